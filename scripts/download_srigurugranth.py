@@ -15,15 +15,18 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
 import hashlib
-import json
+import os
 import re
 import sys
-import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
 from rich.console import Console
 from rich.progress import (
     BarColumn,
@@ -37,7 +40,7 @@ from rich.progress import (
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from ggs.corpus.normalize import NormalizationConfig, normalize
-from ggs.corpus.tokenize import tokenize
+from ggs.corpus.tokenize import TokenizeResult, tokenize
 
 console = Console()
 
@@ -46,6 +49,9 @@ RAW_DIR = PROJECT_ROOT / "data" / "raw_html_srigurugranth"
 CORPUS_DIR = PROJECT_ROOT / "data" / "corpus"
 BASE_URL = "https://srigurugranth.com/{ang:04d}.html"
 TOTAL_ANGS = 1430
+DEFAULT_CONCURRENCY = 16
+DEFAULT_MAX_RPS = 20.0
+WRITE_BATCH_ANGS = 64  # ang chunks per gather write (well under IOV_MAX)
 
 
 def _ang_path(ang: int) -> Path:
@@ -57,52 +63,95 @@ def _ang_path(ang: int) -> Path:
 # ---------------------------------------------------------------------------
 
 
-def download_all(*, delay_ms: int = 200) -> int:
-    """Download all 1430 ang HTML files.
+class _RateLimiter:
+    """Global request pacer for the async download pool.
+
+    Hands out start slots spaced ``1 / max_rps`` seconds apart, so the
+    aggregate request rate stays polite however many requests are in
+    flight.
+    """
+
+    def __init__(self, max_rps: float) -> None:
+        self._interval = 1.0 / max_rps
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def download_all_async(
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_rps: float = DEFAULT_MAX_RPS,
+) -> int:
+    """Download all 1430 ang HTML files concurrently.
+
+    Requests share one HTTP/2 connection pool with at most ``concurrency``
+    in flight; a global rate limit of ``max_rps`` requests per second
+    keeps the aggregate load polite.
 
     Returns count of newly downloaded files.
     """
     RAW_DIR.mkdir(parents=True, exist_ok=True)
+    # One directory scan instead of exists() + stat() per ang.
+    with os.scandir(RAW_DIR) as entries:
+        existing = {
+            int(e.name[4:8]): e.stat().st_size
+            for e in entries
+            if e.name.startswith("ang_") and e.name.endswith(".html")
+        }
+    pending = [
+        ang for ang in range(1, TOTAL_ANGS + 1) if existing.get(ang, 0) <= 100
+    ]
+    sem = asyncio.Semaphore(concurrency)
+    limiter = _RateLimiter(max_rps)
     downloaded = 0
 
-    with (
-        httpx.Client(
-            headers={"User-Agent": "ggs-text-analysis/0.1.0"},
-            follow_redirects=True,
-        ) as client,
-        Progress(
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        headers={"User-Agent": "ggs-text-analysis/0.1.0"},
+        follow_redirects=True,
+        timeout=30.0,
+    ) as client:
+        with Progress(
             TextColumn("[bold blue]{task.description}"),
             BarColumn(),
             MofNCompleteColumn(),
             TimeElapsedColumn(),
             TimeRemainingColumn(),
             console=console,
-        ) as progress,
-    ):
-        task = progress.add_task("Downloading", total=TOTAL_ANGS)
+            refresh_per_second=4,
+        ) as progress:
+            task = progress.add_task("Downloading", total=TOTAL_ANGS)
+            # Already-downloaded angs count in one step
+            progress.advance(task, TOTAL_ANGS - len(pending))
+
+            async def fetch(ang: int) -> None:
+                nonlocal downloaded
+                path = _ang_path(ang)
+                url = BASE_URL.format(ang=ang)
+                async with sem:
+                    await limiter.wait()
+                    try:
+                        resp = await client.get(url)
+                        if resp.status_code == 200:
+                            await asyncio.to_thread(path.write_bytes, resp.content)
+                            downloaded += 1
+                        else:
+                            console.print(
+                                f"  [yellow]Ang {ang}: HTTP {resp.status_code}[/yellow]"
+                            )
+                    except httpx.HTTPError as exc:
+                        console.print(f"  [red]Ang {ang}: {exc}[/red]")
 
-        for ang in range(1, TOTAL_ANGS + 1):
-            path = _ang_path(ang)
-            if path.exists() and path.stat().st_size > 100:
                 progress.advance(task)
-                continue
-
-            url = BASE_URL.format(ang=ang)
-            try:
-                resp = client.get(url, timeout=30.0)
-                if resp.status_code == 200:
-                    path.write_text(resp.text, encoding="utf-8")
-                    downloaded += 1
-                else:
-                    console.print(
-                        f"  [yellow]Ang {ang}: HTTP {resp.status_code}[/yellow]"
-                    )
-            except httpx.HTTPError as exc:
-                console.print(f"  [red]Ang {ang}: {exc}[/red]")
 
-            # Be polite — small delay for static files
-            time.sleep(delay_ms / 1000.0)
-            progress.advance(task)
+            await asyncio.gather(*(fetch(ang) for ang in pending))
 
     return downloaded
 
@@ -111,11 +160,74 @@ def download_all(*, delay_ms: int = 200) -> int:
 # Parse
 # ---------------------------------------------------------------------------
 
+# Gurmukhi line: <P class=Gurb><SPAN ...>...</SPAN> (attrs may be unquoted).
+# The span body is an unrolled "anything up to the first </span>" loop —
+# one linear pass with no lazy-quantifier backtracking.
+_GURB_RE = re.compile(
+    rb'<p\s+class\s*=\s*["\']?gurb["\']?\s*><span[^>]*>'
+    rb"([^<]*(?:<(?!/span>)[^<]*)*)</span>",
+    re.IGNORECASE,
+)
+_TAG_RE = re.compile(rb"<[^>]+>")
+
+# Built once per process (each parser worker gets its own at import).
+_NORM_CONFIG = NormalizationConfig()
+
+# Empty hasher cloned per line instead of constructing a new one.
+_BASE_SHA = hashlib.sha256()
+
+
+# Refrains, mangals and rahao lines recur across angs; normalize and
+# tokenize are pure, so repeats are served from cache.
+@functools.lru_cache(maxsize=65536)
+def _cached_normalize(raw_text: str) -> str:
+    return normalize(raw_text, _NORM_CONFIG)
+
+
+@functools.lru_cache(maxsize=65536)
+def _cached_tokenize(gurmukhi: str) -> TokenizeResult:
+    return tokenize(gurmukhi)
+
 
 def _compute_line_uid(ang: int, line_id: str, gurmukhi: str) -> str:
-    content = f"{ang}:{line_id}:{gurmukhi}"
-    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
-    return f"ang{ang}:sha256:{digest}"
+    # NFC pins the UID to the canonical composition, independent of
+    # which normalization policies produced ``gurmukhi``.
+    content = unicodedata.normalize("NFC", f"{ang}:{line_id}:{gurmukhi}")
+    h = _BASE_SHA.copy()
+    h.update(content.encode())
+    return f"ang{ang}:sha256:{h.hexdigest()[:12]}"
+
+
+def _extract_gurb_lines_xpath(html: bytes) -> list[str]:
+    """Fallback extraction: text of each <p> whose class contains "gurb".
+
+    Takes the first descendant <span> when present (else the <p> itself)
+    and joins its stripped text nodes, skipping empty lines. The raw
+    page bytes are parsed as UTF-8, so pages with an XML encoding
+    declaration are accepted too.
+    """
+    # Deferred: the regex pass covers nearly every page, so most parser
+    # workers never need lxml loaded at all.
+    from lxml import html as lxml_html
+
+    parser = lxml_html.HTMLParser(encoding="utf-8")
+    try:
+        tree = lxml_html.fromstring(html, parser=parser)
+    except lxml_html.etree.LxmlError:
+        # Any lxml failure (e.g. "Document is empty") means no lines;
+        # one bad page must not take down the whole parser pool
+        return []
+
+    lines: list[str] = []
+    for p in tree.xpath(
+        "//p[contains(translate(@class, 'GURB', 'gurb'), 'gurb')]"
+    ):
+        span = p.find(".//span")
+        node = span if span is not None else p
+        text = "".join(t.strip() for t in node.itertext())
+        if text:
+            lines.append(text)
+    return lines
 
 
 def parse_ang(ang: int) -> list[dict]:
@@ -124,46 +236,32 @@ def parse_ang(ang: int) -> list[dict]:
     if not path.exists():
         return []
 
-    html = path.read_text(encoding="utf-8")
-    soup = BeautifulSoup(html, "lxml")
+    html = path.read_bytes()
 
     # Extract Gurmukhi lines: <P class=Gurb> or case variants
-    # BeautifulSoup may lowercase; try multiple approaches
     gurb_lines: list[str] = []
 
-    # Approach 1: regex on raw HTML (most reliable for unquoted attrs)
-    pattern = re.compile(
-        r'<[Pp]\s+class\s*=\s*["\']?Gurb["\']?\s*>'
-        r'<[Ss][Pp][Aa][Nn][^>]*>(.*?)</[Ss][Pp][Aa][Nn]>',
-        re.DOTALL | re.IGNORECASE,
-    )
-    for m in pattern.finditer(html):
-        text = m.group(1).strip()
+    # Approach 1: regex on raw HTML bytes (most reliable for unquoted
+    # attrs).  Only the captured lines are decoded, not the whole page.
+    for m in _GURB_RE.finditer(html):
         # Strip any remaining HTML tags
-        text = re.sub(r"<[^>]+>", "", text).strip()
+        text = _TAG_RE.sub(b"", m.group(1)).decode("utf-8").strip()
         if text:
             gurb_lines.append(text)
 
     if not gurb_lines:
-        # Approach 2: BeautifulSoup with case-insensitive search
-        for p in soup.find_all("p"):
-            cls = p.get("class") or []
-            cls_str = " ".join(cls) if isinstance(cls, list) else str(cls)
-            if "gurb" in cls_str.lower():
-                span = p.find("span")
-                text = span.get_text(strip=True) if span else p.get_text(strip=True)
-                if text:
-                    gurb_lines.append(text)
+        # Approach 2: lxml XPath with case-insensitive class match.
+        # Only run here — the regex pass covers nearly every page.
+        gurb_lines = _extract_gurb_lines_xpath(html)
 
     # Build canonical records
-    norm_config = NormalizationConfig()
     records = []
 
     for idx, raw_text in enumerate(gurb_lines, start=1):
         line_id = f"{ang}:{idx:02d}"
-        gurmukhi = normalize(raw_text, norm_config)
+        gurmukhi = _cached_normalize(raw_text)
 
-        tok_result = tokenize(gurmukhi)
+        tok_result = _cached_tokenize(gurmukhi)
         line_uid = _compute_line_uid(ang, line_id, gurmukhi)
 
         records.append({
@@ -184,6 +282,34 @@ def parse_ang(ang: int) -> list[dict]:
     return records
 
 
+def _parse_ang_jsonl(ang: int) -> tuple[int, bytes]:
+    """Parse one ang and serialize it as a ready-to-write JSONL chunk.
+
+    Runs in the worker, so JSON encoding is parallelized too and only one
+    bytes object per ang crosses the process boundary.
+    """
+    records = parse_ang(ang)
+    chunk = b"".join(
+        orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE) for rec in records
+    )
+    return len(records), chunk
+
+
+def _write_chunks(fd: int, chunks: list[bytes]) -> None:
+    """Write ``chunks`` to ``fd`` with gather writes (one syscall per batch).
+
+    ``os.writev`` may write fewer bytes than requested; the remainder is
+    resubmitted until every chunk is on disk.
+    """
+    views = [memoryview(c) for c in chunks]
+    while views:
+        written = os.writev(fd, views)
+        while views and written >= len(views[0]):
+            written -= len(views.pop(0))
+        if views:
+            views[0] = views[0][written:]
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -199,10 +325,22 @@ def main() -> None:
         help="Skip download, parse existing HTML only",
     )
     parser.add_argument(
-        "--delay-ms",
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Max requests in flight (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        default=DEFAULT_MAX_RPS,
+        help=f"Max requests per second overall (default: {DEFAULT_MAX_RPS:g})",
+    )
+    parser.add_argument(
+        "--workers",
         type=int,
-        default=200,
-        help="Delay between requests in ms (default: 200)",
+        default=None,
+        help="Parser worker processes (default: CPU count)",
     )
     args = parser.parse_args()
 
@@ -212,7 +350,12 @@ def main() -> None:
             "\n[bold cyan]Step 1: Downloading 1430 angs "
             "from srigurugranth.com[/bold cyan]\n"
         )
-        count = download_all(delay_ms=args.delay_ms)
+        count = asyncio.run(
+            download_all_async(
+                concurrency=args.concurrency,
+                max_rps=args.max_rps,
+            )
+        )
         console.print(f"\n[green]Downloaded {count} new files[/green]\n")
     else:
         console.print("[yellow]Skipping download[/yellow]\n")
@@ -226,32 +369,42 @@ def main() -> None:
     CORPUS_DIR.mkdir(parents=True, exist_ok=True)
     jsonl_path = CORPUS_DIR / "ggs_lines.jsonl"
 
-    all_records = []
+    total_lines = 0
     empty_angs = []
 
-    with Progress(
-        TextColumn("[bold blue]{task.description}"),
-        BarColumn(),
-        MofNCompleteColumn(),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
+    with (
+        Progress(
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            console=console,
+            refresh_per_second=4,
+        ) as progress,
+        jsonl_path.open("wb", buffering=0) as fh,
+    ):
         task = progress.add_task("Parsing", total=TOTAL_ANGS)
 
-        for ang in range(1, TOTAL_ANGS + 1):
-            records = parse_ang(ang)
-            if not records:
-                empty_angs.append(ang)
-            all_records.extend(records)
-            progress.advance(task)
-
-    # Write JSONL
-    with jsonl_path.open("w", encoding="utf-8") as fh:
-        for rec in all_records:
-            fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        # Angs are independent, CPU-bound work; map() yields in ang order,
+        # so each ang's JSONL chunk is streamed straight to disk on arrival.
+        angs = range(1, TOTAL_ANGS + 1)
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = pool.map(_parse_ang_jsonl, angs, chunksize=32)
+            pending: list[bytes] = []
+            for ang, (n_lines, chunk) in zip(angs, results, strict=True):
+                if not n_lines:
+                    empty_angs.append(ang)
+                else:
+                    pending.append(chunk)
+                if len(pending) >= WRITE_BATCH_ANGS:
+                    _write_chunks(fh.fileno(), pending)
+                    pending.clear()
+                total_lines += n_lines
+                progress.advance(task)
+            _write_chunks(fh.fileno(), pending)
 
     console.print("\n[bold cyan]Results[/bold cyan]")
-    console.print(f"  Total lines:  {len(all_records)}")
+    console.print(f"  Total lines:  {total_lines}")
     console.print(f"  Total angs:   {TOTAL_ANGS - len(empty_angs)}")
     console.print(f"  Empty angs:   {len(empty_angs)}")
     console.print(f"  Output:       {jsonl_path}")
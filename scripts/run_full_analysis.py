@@ -6,16 +6,21 @@ Usage:
 
 from __future__ import annotations
 
-import json
+import gc
+import heapq
 import math
+import mmap
 import re
 import sys
 import time
 from collections import Counter, defaultdict
+from itertools import combinations
+from operator import itemgetter
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+import orjson
 from rich.console import Console
 from rich.table import Table
 
@@ -34,11 +39,12 @@ CONFIG_PATH = PROJECT_ROOT / "config" / "config.yaml"
 RESULTS_DIR = PROJECT_ROOT / "data" / "derived"
 LEXICON_DIR = PROJECT_ROOT / "lexicon"
 
-# Gurmukhi numeral → int
-_GNUM = {
-    "੧": 1, "੨": 2, "੩": 3, "੪": 4, "੫": 5,
-    "੬": 6, "੭": 7, "੮": 8, "੯": 9,
-}
+TAGS_WRITE_BATCH = 4096
+
+# Pretty-printed UTF-8 with a trailing newline, as json.dump(indent=2) wrote
+_JSON_OPTS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+)
 
 GURU_NAMES = {
     1: "Guru Nanak",
@@ -68,15 +74,66 @@ _BHAGAT_HEADERS: list[tuple[str, str]] = [
     ("ਸਧਨਾ", "Sadhna"),
 ]
 
+# Any bhagat name, in one scan; _BHAGAT_HEADERS order still decides
+# which name wins when a header line contains several.
+_BHAGAT_RE = re.compile(
+    "|".join(re.escape(gur_name) for gur_name, _ in _BHAGAT_HEADERS)
+)
+_HEADER_MARKERS = frozenset({"ਜੀਉ", "ਜੀ", "ਕੀ", "ਕਾ"})
+
+# Phase 5 entity groups
+_RAM_NIRGUN = frozenset({
+    "NIRANKAR", "AKAL", "ALAKH", "AGAM", "NIRANJAN",
+    "NIRBHAU", "NIRVAIR", "AJOONI", "NIRAGUN", "AGOCHAR",
+})
+_RAM_SAGUN = frozenset({
+    "RAMCHANDRA", "SITA", "DASRATH", "LACHMAN", "RAVAN",
+    "KRISHNA", "SHIV", "BRAHMA",
+})
+_INDIC_DIVINE = frozenset({
+    "HARI", "RAM", "GOBIND", "PRABH", "BRAHM",
+    "NARAYANA", "BISN", "THAKUR",
+})
+_INDIC_IDENTITY = frozenset({"HINDU"})
+_ISLAMIC_IDENTITY = frozenset({"MUSALMAN", "TURK"})
+
 _MAHALLA_PAT = re.compile(r"ਮਹਲਾ\s*([੧੨੩੪੫੬੭੮੯]|ਪਹਿਲਾ)")
 
 
-def load_corpus() -> list[dict]:
+def print_phase_header(title: str) -> None:
+    """Print a phase banner as a single console write."""
+    rule = "[bold magenta]" + "-" * 50 + "[/bold magenta]"
+    console.print(f"\n{rule}\n[bold magenta]  {title}[/bold magenta]\n{rule}\n")
+
+
+def write_json(path: Path, obj: object) -> None:
+    """Write ``obj`` as pretty-printed JSON in a single write."""
+    path.write_bytes(orjson.dumps(obj, option=_JSON_OPTS))
+
+
+def load_corpus() -> tuple[list[dict], int, int]:
+    """Load the corpus, returning (records, total_tokens, total_angs)."""
+    # Lines come straight off the page cache via mmap (no whole-file
+    # copy) and orjson decodes each line's UTF-8 bytes directly; the
+    # corpus totals are tallied in the same pass.
     records: list[dict] = []
-    with CORPUS_PATH.open("r", encoding="utf-8") as f:
-        for line in f:
-            records.append(json.loads(line))
-    return records
+    total_tokens = 0
+    angs: set[int] = set()
+    # mmap refuses zero-length files
+    if CORPUS_PATH.stat().st_size == 0:
+        return records, total_tokens, 0
+    with (
+        CORPUS_PATH.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        for line in iter(mm.readline, b""):
+            if line == b"\n":
+                continue
+            rec = orjson.loads(line)
+            records.append(rec)
+            total_tokens += len(rec.get("tokens", ()))
+            angs.add(rec["ang"])
+    return records, total_tokens, len(angs)
 
 
 def load_config() -> dict:
@@ -104,22 +161,24 @@ def extract_authors(
         m = _MAHALLA_PAT.search(g)
         if m:
             num_str = m.group(1)
-            if num_str == "ਪਹਿਲਾ":
-                current_author = GURU_NAMES[1]
-            elif num_str in _GNUM:
-                mahalla = _GNUM[num_str]
-                current_author = GURU_NAMES.get(
-                    mahalla, f"Mahalla {mahalla}"
-                )
+            # Gurmukhi digits are Unicode decimals, so int() reads them
+            mahalla = 1 if num_str == "ਪਹਿਲਾ" else int(num_str)
+            current_author = GURU_NAMES.get(
+                mahalla, f"Mahalla {mahalla}"
+            )
 
         # Check for bhagat header patterns (short lines
         # with bhagat name + ਜੀਉ/ਜੀ/ਕੀ/ਕਾ)
-        for gur_name, eng_name in _BHAGAT_HEADERS:
-            if gur_name in g and len(tokens) < 12:
-                header_markers = {"ਜੀਉ", "ਜੀ", "ਕੀ", "ਕਾ"}
-                if header_markers & set(tokens):
-                    current_author = eng_name
-                    break
+        if (
+            len(tokens) < 12
+            and not _HEADER_MARKERS.isdisjoint(tokens)
+            and _BHAGAT_RE.search(g)
+        ):
+            current_author = next(
+                eng_name
+                for gur_name, eng_name in _BHAGAT_HEADERS
+                if gur_name in g
+            )
 
         uid_to_author[rec["line_uid"]] = current_author
 
@@ -134,9 +193,7 @@ def main() -> None:
 
     # Load corpus
     console.print("[bold]Loading corpus...[/bold]")
-    records = load_corpus()
-    total_tokens = sum(len(r.get("tokens", [])) for r in records)
-    total_angs = len(set(r["ang"] for r in records))
+    records, total_tokens, total_angs = load_corpus()
     console.print(
         f"  {len(records)} lines, {total_tokens} tokens, "
         f"{total_angs} angs\n"
@@ -162,6 +219,8 @@ def main() -> None:
     console.print("[bold]Extracting authors...[/bold]")
     uid_to_author = extract_authors(records)
     author_counts = Counter(uid_to_author.values())
+    # Sorted once; reused by every per-author table and the results
+    author_order = author_counts.most_common()
     unique_authors = sorted(author_counts.keys())
     console.print(f"  {len(unique_authors)} authors identified\n")
 
@@ -169,7 +228,7 @@ def main() -> None:
     table.add_column("Author", style="cyan")
     table.add_column("Lines", justify="right")
     table.add_column("% Corpus", justify="right")
-    for auth, cnt in author_counts.most_common():
+    for auth, cnt in author_order:
         table.add_row(
             auth, str(cnt),
             f"{100 * cnt / len(records):.1f}%",
@@ -179,9 +238,7 @@ def main() -> None:
     # ===================================================================
     # Phase 1: Matching
     # ===================================================================
-    console.print("[bold magenta]" + "-" * 50 + "[/bold magenta]")
-    console.print("[bold magenta]  Phase 1: Lexical Matching[/bold magenta]")
-    console.print("[bold magenta]" + "-" * 50 + "[/bold magenta]\n")
+    print_phase_header("Phase 1: Lexical Matching")
 
     matches_path = RESULTS_DIR / "matches.jsonl"
     all_matches = run_matching(
@@ -203,6 +260,16 @@ def main() -> None:
     console.print(f"  Nested matches: {nested_count}")
     console.print(f"  Confidence: {dict(match_by_confidence)}\n")
 
+    # Shared by the later phases: line -> ang, and top-level (non-nested)
+    # matches grouped by line
+    uid_to_ang = {r["line_uid"]: r["ang"] for r in records}
+    matches_by_line: dict[str, list[MatchRecord]] = defaultdict(
+        list,
+    )
+    for m in all_matches:
+        if m.nested_in is None:
+            matches_by_line[m.line_uid].append(m)
+
     # Top entities table
     table = Table(title="Top 30 Matched Entities")
     table.add_column("#", justify="right", style="dim")
@@ -229,21 +296,40 @@ def main() -> None:
     # ===================================================================
     # Phase 2a: Feature Computation
     # ===================================================================
-    console.print("\n[bold magenta]" + "-" * 50 + "[/bold magenta]")
-    console.print("[bold magenta]  Phase 2a: Feature Computation[/bold magenta]")
-    console.print("[bold magenta]" + "-" * 50 + "[/bold magenta]\n")
+    print_phase_header("Phase 2a: Feature Computation")
 
     features_path = RESULTS_DIR / "features.jsonl"
-    feature_records = compute_corpus_features(
-        records, all_matches, index, output_path=features_path,
-    )
+    # The feature pass builds tens of thousands of small acyclic dicts;
+    # this script owns the process, so skip the cyclic GC's repeated
+    # full-heap scans while it runs.
+    gc.disable()
+    try:
+        feature_records = compute_corpus_features(
+            records, all_matches, index, output_path=features_path,
+        )
+    finally:
+        gc.enable()
+
+    # Column view of the features: line uids, token counts and
+    # per-dimension count and density lists in feature_records order,
+    # built once and shared by every phase below in place of the nested
+    # per-line dicts.  Reductions then run in C (sum/max/list.count).
+    line_uids = [fr["line_uid"] for fr in feature_records]
+    line_tokens = [fr["token_count"] for fr in feature_records]
+    line_features = [fr["features"] for fr in feature_records]
+    dim_counts: dict[str, list[int]] = {}
+    dim_densities: dict[str, list[float]] = {}
+    for dim in FEATURE_DIMENSIONS:
+        column = [feats[dim] for feats in line_features]
+        dim_counts[dim] = [f["count"] for f in column]
+        dim_densities[dim] = [f["density"] for f in column]
 
     # Feature dimension stats
     dim_stats: dict[str, dict] = {}
     for dim in FEATURE_DIMENSIONS:
-        counts = [f["features"][dim]["count"] for f in feature_records]
-        densities = [f["features"][dim]["density"] for f in feature_records]
-        nonzero = sum(1 for c in counts if c > 0)
+        counts = dim_counts[dim]
+        densities = dim_densities[dim]
+        nonzero = len(counts) - counts.count(0)
         total_hits = sum(counts)
         avg_density = sum(densities) / len(densities) if densities else 0
         max_density = max(densities) if densities else 0
@@ -276,33 +362,27 @@ def main() -> None:
     # ===================================================================
     # Phase 2b: Per-Ang Register Density
     # ===================================================================
-    console.print("\n[bold magenta]" + "-" * 50 + "[/bold magenta]")
-    console.print("[bold magenta]  Phase 2b: Register Density by Ang[/bold magenta]")
-    console.print("[bold magenta]" + "-" * 50 + "[/bold magenta]\n")
-
-    # Build line_uid -> ang map
-    uid_to_ang = {r["line_uid"]: r["ang"] for r in records}
+    print_phase_header("Phase 2b: Register Density by Ang")
 
-    # Group features by ang
-    features_by_ang: dict[int, list] = defaultdict(list)
-    for fr in feature_records:
-        ang = uid_to_ang.get(fr["line_uid"])
+    # Per-ang token totals, then per-ang hit totals straight off the
+    # dimension columns (zero counts are skipped — most lines have none)
+    line_angs = [uid_to_ang.get(uid) for uid in line_uids]
+    ang_tokens: dict[int, int] = defaultdict(int)
+    for ang, tokens in zip(line_angs, line_tokens, strict=True):
         if ang is not None:
-            features_by_ang[ang].append(fr)
+            ang_tokens[ang] += tokens
+    sorted_ang_tokens = sorted(ang_tokens.items())
 
-    # Compute per-ang density
-    ang_densities: dict[str, dict[int, float]] = {
-        dim: {} for dim in FEATURE_DIMENSIONS
-    }
-    for ang in sorted(features_by_ang.keys()):
-        ang_features = features_by_ang[ang]
-        for dim in FEATURE_DIMENSIONS:
-            total_count = sum(
-                f["features"][dim]["count"] for f in ang_features
-            )
-            total_tokens = sum(f["token_count"] for f in ang_features)
-            density = total_count / total_tokens if total_tokens > 0 else 0
-            ang_densities[dim][ang] = density
+    ang_densities: dict[str, dict[int, float]] = {}
+    for dim in FEATURE_DIMENSIONS:
+        ang_hits: dict[int, int] = defaultdict(int)
+        for ang, count in zip(line_angs, dim_counts[dim], strict=True):
+            if count and ang is not None:
+                ang_hits[ang] += count
+        ang_densities[dim] = {
+            ang: ang_hits[ang] / tokens if tokens > 0 else 0
+            for ang, tokens in sorted_ang_tokens
+        }
 
     # Peak angs per dimension
     table = Table(title="Peak Register Density by Ang (top 3 per dimension)")
@@ -323,22 +403,14 @@ def main() -> None:
     # ===================================================================
     # Phase 2c: Co-occurrence Analysis
     # ===================================================================
-    console.print("\n[bold magenta]" + "-" * 50 + "[/bold magenta]")
-    console.print(
-        "[bold magenta]  Phase 2c: Co-occurrence (Ang-Level)"
-        "[/bold magenta]"
-    )
-    console.print("[bold magenta]" + "-" * 50 + "[/bold magenta]\n")
-
-    # Build line -> ang mapping for co-occurrence units
-    line_to_ang_co = {r["line_uid"]: r["ang"] for r in records}
+    print_phase_header("Phase 2c: Co-occurrence (Ang-Level)")
 
     # Group matches by ang (as co-occurrence unit)
     matches_by_ang: dict[int, set[str]] = defaultdict(set)
     for m in all_matches:
         if m.nested_in is not None:
             continue
-        ang = line_to_ang_co.get(m.line_uid)
+        ang = uid_to_ang.get(m.line_uid)
         if ang is not None:
             matches_by_ang[ang].add(m.entity_id)
 
@@ -346,27 +418,25 @@ def main() -> None:
     entity_freq: Counter = Counter()
     pair_freq: Counter = Counter()
 
-    for _ang_id, entities in matches_by_ang.items():
-        for eid in entities:
-            entity_freq[eid] += 1
-        elist = sorted(entities)
-        for i in range(len(elist)):
-            for j in range(i + 1, len(elist)):
-                pair_freq[(elist[i], elist[j])] += 1
-
-    # PMI
-    pmi_scores: list[tuple[str, str, float, int]] = []
-    for (e1, e2), count in pair_freq.items():
-        if count < 5:
-            continue
-        p_e1 = entity_freq[e1] / total_shabads
-        p_e2 = entity_freq[e2] / total_shabads
-        p_joint = count / total_shabads
-        if p_e1 > 0 and p_e2 > 0 and p_joint > 0:
-            pmi = math.log2(p_joint / (p_e1 * p_e2))
-            pmi_scores.append((e1, e2, pmi, count))
-
-    pmi_scores.sort(key=lambda x: x[2], reverse=True)
+    for entities in matches_by_ang.values():
+        entity_freq.update(entities)
+        pair_freq.update(combinations(sorted(entities), 2))
+
+    # PMI.  Every entity in a counted pair has freq >= count >= 5, so
+    # all probabilities are positive; only the top 30 are ever reported.
+    entity_p = {e: f / total_shabads for e, f in entity_freq.items()}
+    pmi_scores: list[tuple[str, str, float, int]] = [
+        (
+            e1, e2,
+            math.log2(
+                (count / total_shabads) / (entity_p[e1] * entity_p[e2])
+            ),
+            count,
+        )
+        for (e1, e2), count in pair_freq.items()
+        if count >= 5
+    ]
+    top_pmi = heapq.nlargest(30, pmi_scores, key=itemgetter(2))
 
     console.print(f"  Angs analyzed (as co-occurrence units): {total_shabads}")
     console.print(f"  Entity pairs with count >= 5: {len(pmi_scores)}\n")
@@ -376,7 +446,7 @@ def main() -> None:
     table.add_column("Entity 2", style="cyan")
     table.add_column("PMI", justify="right")
     table.add_column("Co-occur Count", justify="right")
-    for e1, e2, pmi, count in pmi_scores[:20]:
+    for e1, e2, pmi, count in top_pmi[:20]:
         table.add_row(e1, e2, f"{pmi:.3f}", str(count))
     console.print(table)
 
@@ -391,21 +461,22 @@ def main() -> None:
     # ===================================================================
     # Phase 3: Tagging
     # ===================================================================
-    console.print("\n[bold magenta]" + "-" * 50 + "[/bold magenta]")
-    console.print("[bold magenta]  Phase 3: Interpretive Tagging[/bold magenta]")
-    console.print("[bold magenta]" + "-" * 50 + "[/bold magenta]\n")
+    print_phase_header("Phase 3: Interpretive Tagging")
 
     tag_counts: Counter = Counter()
     secondary_tags: Counter = Counter()
     tagged_lines: list[dict] = []
 
-    for fr in feature_records:
-        nirgun = fr["features"]["nirgun"]["count"]
-        sagun = fr["features"]["sagun_narrative"]["count"]
-        ritual = fr["features"]["ritual"]["count"]
-        cleric = fr["features"]["cleric"]["count"]
-        perso = fr["features"]["perso_arabic"]["count"]
-        sanskrit = fr["features"]["sanskritic"]["count"]
+    # One fused pass over the dimension columns; no per-line dict lookups
+    line_rows = zip(*(dim_counts[d] for d in FEATURE_DIMENSIONS), strict=True)
+    for uid, row in zip(line_uids, line_rows, strict=True):
+        line_counts = dict(zip(FEATURE_DIMENSIONS, row, strict=True))
+        nirgun = line_counts["nirgun"]
+        sagun = line_counts["sagun_narrative"]
+        ritual = line_counts["ritual"]
+        cleric = line_counts["cleric"]
+        perso = line_counts["perso_arabic"]
+        sanskrit = line_counts["sanskritic"]
 
         primary = "unmarked"
         if nirgun > 0 and sagun > 0:
@@ -443,12 +514,9 @@ def main() -> None:
             secondary_tags["has_sagun_narrative"] += 1
 
         tagged_lines.append({
-            "line_uid": fr["line_uid"],
+            "line_uid": uid,
             "primary_tag": primary,
-            "features": {
-                d: fr["features"][d]["count"]
-                for d in FEATURE_DIMENSIONS
-            },
+            "features": line_counts,
         })
 
     table = Table(title="Primary Tag Distribution")
@@ -472,14 +540,14 @@ def main() -> None:
     # ===================================================================
     # Cross-register mixing
     # ===================================================================
-    console.print("\n[bold magenta]" + "-" * 50 + "[/bold magenta]")
-    console.print("[bold magenta]  Cross-Register Mixing[/bold magenta]")
-    console.print("[bold magenta]" + "-" * 50 + "[/bold magenta]\n")
+    print_phase_header("Cross-Register Mixing")
 
     both = perso_only = sanskrit_only = 0
-    for fr in feature_records:
-        has_perso = fr["features"]["perso_arabic"]["count"] > 0
-        has_sanskrit = fr["features"]["sanskritic"]["count"] > 0
+    for perso, sanskrit in zip(
+        dim_counts["perso_arabic"], dim_counts["sanskritic"], strict=True,
+    ):
+        has_perso = perso > 0
+        has_sanskrit = sanskrit > 0
         if has_perso and has_sanskrit:
             both += 1
         elif has_perso:
@@ -498,9 +566,11 @@ def main() -> None:
 
     # Nirgun + Sagun overlap
     nirgun_only = sagun_only = nirgun_sagun_both = 0
-    for fr in feature_records:
-        has_nirgun = fr["features"]["nirgun"]["count"] > 0
-        has_sagun = fr["features"]["sagun_narrative"]["count"] > 0
+    for nirgun, sagun in zip(
+        dim_counts["nirgun"], dim_counts["sagun_narrative"], strict=True,
+    ):
+        has_nirgun = nirgun > 0
+        has_sagun = sagun > 0
         if has_nirgun and has_sagun:
             nirgun_sagun_both += 1
         elif has_nirgun:
@@ -515,38 +585,38 @@ def main() -> None:
     # ===================================================================
     # Phase 4: Per-Author Analysis
     # ===================================================================
-    console.print("\n[bold magenta]" + "-" * 50 + "[/bold magenta]")
-    console.print(
-        "[bold magenta]  Phase 4: Per-Author Analysis"
-        "[/bold magenta]"
-    )
-    console.print("[bold magenta]" + "-" * 50 + "[/bold magenta]\n")
-
-    # Group matches and features by author
-    matches_by_line: dict[str, list[MatchRecord]] = defaultdict(
-        list,
-    )
-    for m in all_matches:
-        if m.nested_in is None:
-            matches_by_line[m.line_uid].append(m)
-
-    author_entity_freq: dict[str, Counter] = defaultdict(Counter)
-    author_dim_lines: dict[str, dict[str, int]] = defaultdict(
-        lambda: {d: 0 for d in FEATURE_DIMENSIONS},
-    )
+    print_phase_header("Phase 4: Per-Author Analysis")
+
+    # Group matches and features by author.  extract_authors assigned
+    # every line an author, so all tallies are allocated up front: one
+    # Counter and one per-dimension int list per author, indexed in
+    # FEATURE_DIMENSIONS order.
+    author_entity_freq: dict[str, Counter] = {
+        a: Counter() for a in unique_authors
+    }
+    author_dim_hits: dict[str, list[int]] = {
+        a: [0] * len(FEATURE_DIMENSIONS) for a in unique_authors
+    }
     author_line_counts: Counter = Counter()
 
-    for fr in feature_records:
-        uid = fr["line_uid"]
-        author = uid_to_author.get(uid, "Unknown")
+    line_rows = zip(*(dim_counts[d] for d in FEATURE_DIMENSIONS), strict=True)
+    for uid, row in zip(line_uids, line_rows, strict=True):
+        author = uid_to_author[uid]
         author_line_counts[author] += 1
 
-        for m in matches_by_line.get(uid, []):
-            author_entity_freq[author][m.entity_id] += 1
+        author_entity_freq[author].update(
+            m.entity_id for m in matches_by_line.get(uid, ())
+        )
 
-        for dim in FEATURE_DIMENSIONS:
-            if fr["features"][dim]["count"] > 0:
-                author_dim_lines[author][dim] += 1
+        hits = author_dim_hits[author]
+        for i, count in enumerate(row):
+            if count > 0:
+                hits[i] += 1
+
+    author_dim_lines: dict[str, dict[str, int]] = {
+        a: dict(zip(FEATURE_DIMENSIONS, hits, strict=True))
+        for a, hits in author_dim_hits.items()
+    }
 
     # Per-author register density table
     table = Table(
@@ -556,10 +626,11 @@ def main() -> None:
     table.add_column("Lines", justify="right")
     for dim in FEATURE_DIMENSIONS:
         table.add_column(dim[:8], justify="right")
-    for auth, cnt in author_counts.most_common():
+    for auth, cnt in author_order:
         row = [auth, str(cnt)]
+        dim_lines = author_dim_lines[auth]
         for dim in FEATURE_DIMENSIONS:
-            n = author_dim_lines[auth][dim]
+            n = dim_lines[dim]
             pct = 100 * n / cnt if cnt > 0 else 0
             row.append(f"{pct:.1f}%")
         table.add_row(*row)
@@ -569,17 +640,15 @@ def main() -> None:
     author_profiles: dict[str, dict] = {}
     for auth in unique_authors:
         top = author_entity_freq[auth].most_common(10)
+        dim_lines = author_dim_lines[auth]
+        lines = author_line_counts[auth]
         author_profiles[auth] = {
-            "lines": author_line_counts[auth],
+            "lines": lines,
             "top_entities": [
                 {"entity_id": e, "count": c} for e, c in top
             ],
             "register_pct": {
-                dim: round(
-                    100 * author_dim_lines[auth][dim]
-                    / max(1, author_line_counts[auth]),
-                    2,
-                )
+                dim: round(100 * dim_lines[dim] / max(1, lines), 2)
                 for dim in FEATURE_DIMENSIONS
             },
         }
@@ -587,39 +656,27 @@ def main() -> None:
     # ===================================================================
     # Phase 5: Semantic Analysis
     # ===================================================================
-    console.print("\n[bold magenta]" + "-" * 50 + "[/bold magenta]")
-    console.print(
-        "[bold magenta]  Phase 5: Semantic Analysis"
-        "[/bold magenta]"
-    )
-    console.print("[bold magenta]" + "-" * 50 + "[/bold magenta]\n")
+    print_phase_header("Phase 5: Semantic Analysis")
+
+    # Distinct entities per matched line, shared by 5a-5c
+    line_entity_sets = [
+        {m.entity_id for m in line_matches}
+        for line_matches in matches_by_line.values()
+    ]
 
     # 5a: RAM semantic behavior — what co-occurs with RAM
     # on the same LINE?
     ram_cooccur: Counter = Counter()
     ram_line_count = 0
-    for _uid, line_matches in matches_by_line.items():
-        eids = {m.entity_id for m in line_matches}
+    for eids in line_entity_sets:
         if "RAM" in eids:
             ram_line_count += 1
             for e in eids:
                 if e != "RAM":
                     ram_cooccur[e] += 1
 
-    ram_nirgun = sum(
-        c for e, c in ram_cooccur.items()
-        if e in {
-            "NIRANKAR", "AKAL", "ALAKH", "AGAM", "NIRANJAN",
-            "NIRBHAU", "NIRVAIR", "AJOONI", "NIRAGUN", "AGOCHAR",
-        }
-    )
-    ram_sagun = sum(
-        c for e, c in ram_cooccur.items()
-        if e in {
-            "RAMCHANDRA", "SITA", "DASRATH", "LACHMAN", "RAVAN",
-            "KRISHNA", "SHIV", "BRAHMA",
-        }
-    )
+    ram_nirgun = sum(ram_cooccur[e] for e in _RAM_NIRGUN)
+    ram_sagun = sum(ram_cooccur[e] for e in _RAM_SAGUN)
     console.print(f"  RAM appears on {ram_line_count} lines")
     console.print(
         f"  RAM + nirgun marker: {ram_nirgun} co-occurrences"
@@ -636,15 +693,10 @@ def main() -> None:
     allah_cooccur: Counter = Counter()
     allah_line_count = 0
     allah_with_indic = 0
-    for _uid, line_matches in matches_by_line.items():
-        eids = {m.entity_id for m in line_matches}
+    for eids in line_entity_sets:
         if "ALLAH" in eids:
             allah_line_count += 1
-            indic_entities = {
-                "HARI", "RAM", "GOBIND", "PRABH", "BRAHM",
-                "NARAYANA", "BISN", "THAKUR",
-            }
-            if eids & indic_entities:
+            if not _INDIC_DIVINE.isdisjoint(eids):
                 allah_with_indic += 1
             for e in eids:
                 if e != "ALLAH":
@@ -665,15 +717,9 @@ def main() -> None:
     # 5c: Cross-tradition lines (Hindu + Muslim identity markers)
     cross_trad_lines = 0
     identity_lines = 0
-    for fr in feature_records:
-        uid = fr["line_uid"]
-        eids = {
-            m.entity_id for m in matches_by_line.get(uid, [])
-        }
-        has_indic_id = bool(eids & {"HINDU"})
-        has_islamic_id = bool(
-            eids & {"MUSALMAN", "TURK"}
-        )
+    for eids in line_entity_sets:
+        has_indic_id = not _INDIC_IDENTITY.isdisjoint(eids)
+        has_islamic_id = not _ISLAMIC_IDENTITY.isdisjoint(eids)
         if has_indic_id or has_islamic_id:
             identity_lines += 1
         if has_indic_id and has_islamic_id:
@@ -690,12 +736,7 @@ def main() -> None:
     # ===================================================================
     # Phase 6: Composite Indices
     # ===================================================================
-    console.print("\n[bold magenta]" + "-" * 50 + "[/bold magenta]")
-    console.print(
-        "[bold magenta]  Phase 6: Composite Indices"
-        "[/bold magenta]"
-    )
-    console.print("[bold magenta]" + "-" * 50 + "[/bold magenta]\n")
+    print_phase_header("Phase 6: Composite Indices")
 
     # 6a: Stoic-Bhakti-Advaita triangle per author
     console.print("[bold]Stoic-Bhakti-Advaita Triangle:[/bold]")
@@ -711,11 +752,12 @@ def main() -> None:
     table.add_column("Devotion", justify="right", style="green")
     table.add_column("Nirgun", justify="right", style="magenta")
     table.add_column("Oneness", justify="right", style="blue")
-    for auth, cnt in author_counts.most_common():
-        pct_e = author_dim_lines[auth]["ethical"]
-        pct_d = author_dim_lines[auth]["devotional"]
-        pct_n = author_dim_lines[auth]["nirgun"]
-        pct_o = author_dim_lines[auth]["oneness"]
+    for auth, cnt in author_order:
+        dim_lines = author_dim_lines[auth]
+        pct_e = dim_lines["ethical"]
+        pct_d = dim_lines["devotional"]
+        pct_n = dim_lines["nirgun"]
+        pct_o = dim_lines["oneness"]
         table.add_row(
             auth, str(cnt),
             f"{100 * pct_e / cnt:.1f}%",
@@ -766,9 +808,7 @@ def main() -> None:
             "total_tokens": total_tokens,
             "total_angs": total_angs,
             "total_authors": len(unique_authors),
-            "author_distribution": {
-                a: c for a, c in author_counts.most_common()
-            },
+            "author_distribution": dict(author_order),
         },
         "matching": {
             "total_matches": len(all_matches),
@@ -819,7 +859,7 @@ def main() -> None:
                     "e1": e1, "e2": e2,
                     "pmi": round(pmi, 3), "count": c,
                 }
-                for e1, e2, pmi, c in pmi_scores[:30]
+                for e1, e2, pmi, c in top_pmi
             ],
             "top_frequency": [
                 {"e1": e1, "e2": e2, "count": c}
@@ -859,16 +899,19 @@ def main() -> None:
     }
 
     results_path = RESULTS_DIR / "analysis_results.json"
-    with results_path.open("w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    write_json(results_path, results)
     console.print(f"  {results_path}")
 
     # Save tags
     tags_path = RESULTS_DIR / "tags.jsonl"
-    with tags_path.open("w", encoding="utf-8") as f:
-        for tl in tagged_lines:
-            f.write(json.dumps(tl, ensure_ascii=False) + "\n")
+    with tags_path.open("wb") as f:
+        # A few thousand lines per write keeps the encoded payload small
+        # without paying a write call per line.
+        for start in range(0, len(tagged_lines), TAGS_WRITE_BATCH):
+            f.write(b"".join(
+                orjson.dumps(tl, option=orjson.OPT_APPEND_NEWLINE)
+                for tl in tagged_lines[start:start + TAGS_WRITE_BATCH]
+            ))
     console.print(f"  {tags_path}")
 
     # Save per-ang density
@@ -877,9 +920,7 @@ def main() -> None:
         dim: {str(ang): round(d, 6) for ang, d in densities.items()}
         for dim, densities in ang_densities.items()
     }
-    with density_path.open("w", encoding="utf-8") as f:
-        json.dump(density_export, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    write_json(density_path, density_export)
     console.print(f"  {density_path}")
 
     elapsed = time.monotonic() - t0
@@ -19,16 +19,17 @@ Reference: PLAN.md Section 5.1
 
 from __future__ import annotations
 
-import json
 import math
 import time
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from enum import StrEnum
-from itertools import combinations
+from itertools import chain, combinations
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+import orjson
 from rich.console import Console
 
 from ggs.analysis.match import MatchRecord
@@ -154,17 +155,23 @@ def build_line_to_shabad_map(
         Mapping from line_uid to shabad_uid.
     """
     line_to_shabad: dict[str, str] = {}
+    # One fallback id per ang, shared by all of its lines
+    ang_uids: dict[int, str] = {}
 
     for rec in records:
         line_uid = rec.get("line_uid", "UNKNOWN")
-        shabad_uid = rec.get("meta", {}).get("shabad_uid")
+        meta = rec.get("meta")
+        shabad_uid = meta.get("shabad_uid") if meta else None
         if shabad_uid is not None:
             line_to_shabad[line_uid] = shabad_uid
         else:
             # Fallback: use ang number as a coarse shabad grouping
             ang = rec.get("ang")
             if ang is not None:
-                line_to_shabad[line_uid] = f"ang:{ang}"
+                ang_uid = ang_uids.get(ang)
+                if ang_uid is None:
+                    ang_uid = ang_uids[ang] = f"ang:{ang}"
+                line_to_shabad[line_uid] = ang_uid
 
     return line_to_shabad
 
@@ -185,14 +192,11 @@ def _count_pairs(
     Returns:
         Mapping from (entity_a, entity_b) to raw co-occurrence count.
     """
-    pair_counts: dict[tuple[str, str], int] = defaultdict(int)
-
-    for entities in windows.values():
-        if len(entities) < 2:
-            continue
-        for a, b in combinations(sorted(entities), 2):
-            pair_counts[(a, b)] += 1
-
+    # Counter's C counting loop consumes the chained pair stream directly;
+    # windows with fewer than two entities contribute no combinations.
+    pair_counts = Counter(chain.from_iterable(
+        combinations(sorted(entities), 2) for entities in windows.values()
+    ))
     return dict(pair_counts)
 
 
@@ -204,11 +208,7 @@ def _count_entity_occurrences(
     Returns:
         Mapping from entity_id to window count.
     """
-    counts: dict[str, int] = defaultdict(int)
-    for entities in windows.values():
-        for eid in entities:
-            counts[eid] += 1
-    return dict(counts)
+    return dict(Counter(chain.from_iterable(windows.values())))
 
 
 # ---------------------------------------------------------------------------
@@ -326,17 +326,20 @@ def _filter_by_entity_freq(
         min_entity_freq: Minimum number of windows an entity must appear in.
 
     Returns:
-        Filtered copy of windows with rare entities removed.
+        Filtered copy of windows with rare entities removed, or
+        ``windows`` itself when no entity falls below the threshold.
     """
     if min_entity_freq <= 1:
         return windows
 
     # Count entity frequencies across all windows
     entity_counts = _count_entity_occurrences(windows)
-    frequent = {
+    frequent = frozenset(
         eid for eid, count in entity_counts.items()
         if count >= min_entity_freq
-    }
+    )
+    if len(frequent) == len(entity_counts):
+        return windows
 
     # Filter windows
     filtered: dict[str, set[str]] = {}
@@ -394,15 +397,31 @@ def compute_cooccurrence(
     entity_counts = _count_entity_occurrences(filtered_windows)
     num_unique_entities = len(entity_counts)
 
+    # Window-level constants for the metric formulas, computed once
+    # rather than per pair.
+    v = num_unique_entities
+    n_eff = total_windows + smoothing_k * v * v
+    entity_p = {
+        eid: count / total_windows for eid, count in entity_counts.items()
+    }
+    level = str(window_level)
+
+    # Order the retained pairs before building records: highest
+    # raw_count first, then alphabetically.  Sorting the ((a, b), count)
+    # items by their unique (a, b) key and then stably by count gives
+    # that order without a key tuple per pair.
+    kept = sorted(
+        item for item in pair_counts.items() if item[1] >= min_count
+    )
+    kept.sort(key=itemgetter(1), reverse=True)
+
     # Build pair records with metrics
     pairs: list[CooccurrencePair] = []
 
-    for (entity_a, entity_b), raw_count in pair_counts.items():
-        if raw_count < min_count:
-            continue
-
-        count_a = entity_counts.get(entity_a, 0)
-        count_b = entity_counts.get(entity_b, 0)
+    for (entity_a, entity_b), raw_count in kept:
+        # Every entity in a counted pair occurs in at least that many windows
+        count_a = entity_counts[entity_a]
+        count_b = entity_counts[entity_b]
 
         jaccard = _compute_jaccard(raw_count, count_a, count_b)
 
@@ -421,23 +440,19 @@ def compute_cooccurrence(
                 total_windows, num_unique_entities, smoothing_k,
             )
             # NPMI normalization with smoothed joint probability
-            v = num_unique_entities
-            n_eff = total_windows + smoothing_k * v * v
             p_ab_smoothed = (raw_count + smoothing_k) / n_eff
             npmi = _compute_npmi(pmi, p_ab_smoothed)
         else:
             # Unsmoothed PMI
             p_ab = raw_count / total_windows
-            p_a = count_a / total_windows
-            p_b = count_b / total_windows
-            pmi = _compute_pmi(p_ab, p_a, p_b)
+            pmi = _compute_pmi(p_ab, entity_p[entity_a], entity_p[entity_b])
             npmi = _compute_npmi(pmi, p_ab)
 
         pairs.append(
             CooccurrencePair(
                 entity_a=entity_a,
                 entity_b=entity_b,
-                window_level=str(window_level),
+                window_level=level,
                 raw_count=raw_count,
                 pmi=pmi,
                 npmi=npmi,
@@ -445,11 +460,6 @@ def compute_cooccurrence(
             ),
         )
 
-    # Sort: highest raw_count first, then alphabetically
-    pairs.sort(
-        key=lambda p: (-p.raw_count, p.entity_a, p.entity_b),
-    )
-
     return pairs
 
 
@@ -562,7 +572,6 @@ def _write_output(
             "pairs": [p.to_dict() for p in pairs],
         }
 
-    with output_path.open("w", encoding="utf-8") as fh:
-        json.dump(output, fh, ensure_ascii=False, indent=2)
+    output_path.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
 
     _console.print(f"  Written to {output_path}")
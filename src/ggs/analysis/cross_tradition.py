@@ -15,13 +15,13 @@ Reference: PLAN.md Section 5.1
 
 from __future__ import annotations
 
-import json
 import time
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import orjson
 from rich.console import Console
 
 from ggs.analysis.cooccurrence import CooccurrencePair
@@ -129,17 +129,16 @@ def filter_cross_tradition_pairs(
     Returns:
         List of :class:`CrossTraditionPair` records.
     """
-    cross_pairs: list[CrossTraditionPair] = []
+    # Unknown entities and entities without a tradition both map to None
+    tradition_of = {
+        entity_id: entity.tradition
+        for entity_id, entity in index.entities.items()
+    }.get
+    kept: list[tuple[CooccurrencePair, str, str]] = []
 
     for pair in pairs:
-        entity_a = index.entities.get(pair.entity_a)
-        entity_b = index.entities.get(pair.entity_b)
-
-        if entity_a is None or entity_b is None:
-            continue
-
-        tradition_a = entity_a.tradition
-        tradition_b = entity_b.tradition
+        tradition_a = tradition_of(pair.entity_a)
+        tradition_b = tradition_of(pair.entity_b)
 
         if tradition_a is None or tradition_b is None:
             continue
@@ -147,28 +146,33 @@ def filter_cross_tradition_pairs(
         if tradition_a == tradition_b:
             continue
 
-        cross_pairs.append(
-            CrossTraditionPair(
-                entity_a=pair.entity_a,
-                entity_b=pair.entity_b,
-                tradition_a=tradition_a,
-                tradition_b=tradition_b,
-                window_level=pair.window_level,
-                raw_count=pair.raw_count,
-                pmi=pair.pmi,
-                npmi=pair.npmi,
-                jaccard=pair.jaccard,
-            ),
+        kept.append((pair, tradition_a, tradition_b))
+
+    # Sort: NPMI descending (None last), then raw_count descending.
+    # Sorting the kept source pairs first means each CrossTraditionPair
+    # is built once, directly in its final position.
+    def _sort_key(
+        item: tuple[CooccurrencePair, str, str],
+    ) -> tuple[bool, float, int]:
+        npmi = item[0].npmi
+        return (npmi is None, -(npmi or 0.0), -item[0].raw_count)
+
+    kept.sort(key=_sort_key)
+
+    return [
+        CrossTraditionPair(
+            entity_a=pair.entity_a,
+            entity_b=pair.entity_b,
+            tradition_a=tradition_a,
+            tradition_b=tradition_b,
+            window_level=pair.window_level,
+            raw_count=pair.raw_count,
+            pmi=pair.pmi,
+            npmi=pair.npmi,
+            jaccard=pair.jaccard,
         )
-
-    # Sort: NPMI descending (None last), then raw_count descending
-    def _sort_key(p: CrossTraditionPair) -> tuple[int, float, int]:
-        has_npmi = 0 if p.npmi is not None else 1
-        npmi_val = -(p.npmi or 0.0)
-        return (has_npmi, npmi_val, -p.raw_count)
-
-    cross_pairs.sort(key=_sort_key)
-    return cross_pairs
+        for pair, tradition_a, tradition_b in kept
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -232,17 +236,24 @@ def find_ritual_negation_lines(
     Returns:
         List of :class:`RitualNegationLine` records.
     """
+    # Classify each distinct entity once rather than once per match
+    ritual_ids = frozenset(
+        entity_id
+        for entity_id in {m.entity_id for m in matches}
+        if _is_ritual_entity(entity_id, index)
+    )
+
     # Index matches by line
     ritual_by_line: dict[str, set[str]] = defaultdict(set)
     for m in matches:
-        if m.nested_in is not None:
-            continue
-        if _is_ritual_entity(m.entity_id, index):
+        if m.nested_in is None and m.entity_id in ritual_ids:
             ritual_by_line[m.line_uid].add(m.entity_id)
 
-    # Index records by line_uid
+    # Index only the records that carry a ritual entity
     record_by_line: dict[str, dict[str, Any]] = {
-        rec.get("line_uid", ""): rec for rec in records
+        line_uid: rec
+        for rec in records
+        if (line_uid := rec.get("line_uid", "")) in ritual_by_line
     }
 
     results: list[RitualNegationLine] = []
@@ -253,10 +264,10 @@ def find_ritual_negation_lines(
         gurmukhi = rec.get("gurmukhi", "")
         ang = rec.get("ang")
 
-        # Find negation tokens on this line
-        found_negation = [
-            t for t in tokens if t in NEGATION_TOKENS
-        ]
+        # Find negation tokens on this line; the C-level intersection
+        # rules out most lines before any per-token filtering
+        hits = NEGATION_TOKENS.intersection(tokens)
+        found_negation = [t for t in tokens if t in hits] if hits else []
 
         if found_negation:
             results.append(
@@ -321,16 +332,19 @@ def compute_cross_tradition_analysis(
         f"{len(shabad_cross)} shabad-level",
     )
 
-    # Tradition-pair summary
-    tradition_pair_counts: dict[str, int] = defaultdict(int)
-    for ct in line_cross:
-        pair_label = f"{ct.tradition_a}+{ct.tradition_b}"
-        tradition_pair_counts[pair_label] += 1
+    # Tradition-pair summary; labels are formatted once per distinct pair
+    tradition_pair_counts: dict[str, int] = {
+        f"{tradition_a}+{tradition_b}": count
+        for (tradition_a, tradition_b), count in Counter(
+            (ct.tradition_a, ct.tradition_b) for ct in line_cross
+        ).items()
+    }
 
-    for label in sorted(tradition_pair_counts.keys()):
-        _console.print(
-            f"    {label}: {tradition_pair_counts[label]} pairs",
-        )
+    if tradition_pair_counts:
+        _console.print("\n".join(
+            f"    {label}: {tradition_pair_counts[label]} pairs"
+            for label in sorted(tradition_pair_counts)
+        ))
 
     # Ritual + negation
     ritual_negation = find_ritual_negation_lines(
@@ -355,14 +369,15 @@ def compute_cross_tradition_analysis(
             "cross_tradition_line_pairs": len(line_cross),
             "cross_tradition_shabad_pairs": len(shabad_cross),
             "ritual_negation_lines": len(ritual_negation),
-            "tradition_pair_counts": dict(tradition_pair_counts),
+            "tradition_pair_counts": tradition_pair_counts,
         },
     }
 
     if output_path is not None:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with output_path.open("w", encoding="utf-8") as fh:
-            json.dump(result, fh, ensure_ascii=False, indent=2)
+        output_path.write_bytes(
+            orjson.dumps(result, option=orjson.OPT_INDENT_2),
+        )
         _console.print(f"  Written to {output_path}")
 
     return result
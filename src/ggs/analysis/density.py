@@ -14,19 +14,26 @@ Reference: PLAN.md Section 5.2
 
 from __future__ import annotations
 
-import json
+import functools
+import math
 import statistics
 import time
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import orjson
 import yaml
 from rich.console import Console
 
 from ggs.analysis.features import FEATURE_DIMENSIONS
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 _console = Console()
 
 
@@ -55,7 +62,9 @@ class RagaSection:
 def load_raga_sections(ragas_path: Path) -> list[RagaSection]:
     """Load raga sections from ragas.yaml.
 
-    Includes preamble and epilogue as pseudo-raga sections.
+    Includes preamble and epilogue as pseudo-raga sections. Parsed
+    sections are cached per path and modification time, so repeated
+    calls in one process skip the YAML parse until the file changes.
 
     Args:
         ragas_path: Path to ragas.yaml.
@@ -63,6 +72,16 @@ def load_raga_sections(ragas_path: Path) -> list[RagaSection]:
     Returns:
         List of RagaSection in text order.
     """
+    mtime_ns = ragas_path.stat().st_mtime_ns
+    return list(_load_raga_sections_cached(ragas_path, mtime_ns))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_raga_sections_cached(
+    ragas_path: Path,
+    mtime_ns: int,
+) -> tuple[RagaSection, ...]:
+    """Parse ragas.yaml; ``mtime_ns`` is only part of the cache key."""
     data = yaml.safe_load(ragas_path.read_text(encoding="utf-8"))
 
     sections: list[RagaSection] = []
@@ -102,7 +121,7 @@ def load_raga_sections(ragas_path: Path) -> list[RagaSection]:
             ),
         )
 
-    return sections
+    return tuple(sections)
 
 
 def ang_to_raga(
@@ -119,6 +138,22 @@ def ang_to_raga(
     return None
 
 
+def build_ang_to_raga(
+    sections: list[RagaSection],
+) -> dict[int, str]:
+    """Map every ang covered by ``sections`` to its raga section ID.
+
+    Resolves overlaps the way :func:`ang_to_raga` does (first section
+    wins), so a lookup in the returned dict agrees with calling
+    :func:`ang_to_raga` for every ang, at O(1) per query.
+    """
+    ang_raga: dict[int, str] = {}
+    for section in sections:
+        for ang in range(section.ang_start, section.ang_end + 1):
+            ang_raga.setdefault(ang, section.id)
+    return ang_raga
+
+
 # ---------------------------------------------------------------------------
 # Aggregation records
 # ---------------------------------------------------------------------------
@@ -214,15 +249,19 @@ class WindowDensity:
 def _index_features_by_ang(
     feature_records: list[dict[str, Any]],
     corpus_records: list[dict[str, Any]],
-) -> dict[int, list[dict[str, float]]]:
-    """Build a mapping from ang number to list of density dicts.
+) -> dict[int, list[tuple[float, ...]]]:
+    """Build a mapping from ang number to packed per-line density rows.
+
+    Each row is a tuple of densities in ``FEATURE_DIMENSIONS`` order, so
+    the aggregations can transpose a group into per-dimension columns
+    with a single ``zip(*rows)``.
 
     Args:
         feature_records: Feature records from features.jsonl.
         corpus_records: Corpus records from ggs_lines.jsonl.
 
     Returns:
-        Mapping from ang to list of density dicts for each line.
+        Mapping from ang to list of density rows for each line.
     """
     # Build line_uid -> ang mapping
     uid_to_ang: dict[str, int] = {}
@@ -232,19 +271,29 @@ def _index_features_by_ang(
         if ang is not None:
             uid_to_ang[line_uid] = ang
 
-    # Group feature densities by ang
-    by_ang: dict[int, list[dict[str, float]]] = defaultdict(list)
+    # Group feature densities by ang. Records from compute_line_features
+    # carry every dimension, so the C-level getters handle them; partial
+    # records fall back to per-dimension defaults.
+    dims = FEATURE_DIMENSIONS
+    get_dims = itemgetter(*dims)
+    get_density = itemgetter("density")
+    no_feature: dict[str, float] = {}
+    by_ang: dict[int, list[tuple[float, ...]]] = defaultdict(list)
     for feat in feature_records:
         line_uid = feat.get("line_uid", "")
         ang = uid_to_ang.get(line_uid)
         if ang is None:
             continue
 
-        densities: dict[str, float] = {}
-        features = feat.get("features", {})
-        for dim in FEATURE_DIMENSIONS:
-            densities[dim] = features.get(dim, {}).get("density", 0.0)
-        by_ang[ang].append(densities)
+        features = feat.get("features", no_feature)
+        try:
+            row = tuple(map(get_density, get_dims(features)))
+        except KeyError:
+            row = tuple([
+                features.get(dim, no_feature).get("density", 0.0)
+                for dim in dims
+            ])
+        by_ang[ang].append(row)
 
     return dict(by_ang)
 
@@ -254,25 +303,46 @@ def _index_features_by_ang(
 # ---------------------------------------------------------------------------
 
 
-def _safe_mean(values: list[float]) -> float:
+def _safe_mean(values: Sequence[float]) -> float:
     """Compute mean, returning 0.0 for empty lists."""
     if not values:
         return 0.0
-    return statistics.mean(values)
+    return math.fsum(values) / len(values)
 
 
-def _safe_median(values: list[float]) -> float:
+def _safe_median(values: Sequence[float]) -> float:
     """Compute median, returning 0.0 for empty lists."""
     if not values:
         return 0.0
     return statistics.median(values)
 
 
-def _safe_stdev(values: list[float]) -> float:
-    """Compute sample standard deviation, returning 0.0 for < 2 values."""
-    if len(values) < 2:
+def _columns(
+    rows: list[tuple[float, ...]],
+) -> list[tuple[float, ...]]:
+    """Transpose density rows into one column per feature dimension."""
+    if not rows:
+        return [() for _ in FEATURE_DIMENSIONS]
+    return list(zip(*rows, strict=True))
+
+
+def _safe_stdev(
+    values: Sequence[float],
+    mean: float | None = None,
+) -> float:
+    """Compute sample standard deviation, returning 0.0 for < 2 values.
+
+    Two-pass float computation over ``math.fsum``; pass ``mean`` when the
+    caller already has it to skip the first pass.
+    """
+    n = len(values)
+    if n < 2:
         return 0.0
-    return statistics.stdev(values)
+    if mean is None:
+        mean = math.fsum(values) / n
+    return math.sqrt(
+        math.fsum([(v - mean) * (v - mean) for v in values]) / (n - 1),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -281,12 +351,12 @@ def _safe_stdev(values: list[float]) -> float:
 
 
 def compute_ang_densities(
-    features_by_ang: dict[int, list[dict[str, float]]],
+    features_by_ang: dict[int, list[tuple[float, ...]]],
 ) -> list[AngDensity]:
     """Compute mean density per register for each ang.
 
     Args:
-        features_by_ang: Mapping from ang to list of density dicts.
+        features_by_ang: Mapping from ang to list of density rows.
 
     Returns:
         List of AngDensity records, sorted by ang number.
@@ -294,19 +364,16 @@ def compute_ang_densities(
     results: list[AngDensity] = []
 
     for ang in sorted(features_by_ang.keys()):
-        line_densities = features_by_ang[ang]
-        line_count = len(line_densities)
-
-        mean_densities: dict[str, float] = {}
-        for dim in FEATURE_DIMENSIONS:
-            values = [d.get(dim, 0.0) for d in line_densities]
-            mean_densities[dim] = _safe_mean(values)
-
+        rows = features_by_ang[ang]
         results.append(
             AngDensity(
                 ang=ang,
-                line_count=line_count,
-                densities=mean_densities,
+                line_count=len(rows),
+                densities=dict(zip(
+                    FEATURE_DIMENSIONS,
+                    map(_safe_mean, _columns(rows)),
+                    strict=True,
+                )),
             ),
         )
 
@@ -319,7 +386,7 @@ def compute_ang_densities(
 
 
 def compute_raga_densities(
-    features_by_ang: dict[int, list[dict[str, float]]],
+    features_by_ang: dict[int, list[tuple[float, ...]]],
     sections: list[RagaSection],
 ) -> list[RagaDensity]:
     """Compute density statistics per raga section.
@@ -328,7 +395,7 @@ def compute_raga_densities(
     computes mean, median, and standard deviation per register.
 
     Args:
-        features_by_ang: Mapping from ang to list of density dicts.
+        features_by_ang: Mapping from ang to list of density rows.
         sections: Raga sections from ragas.yaml.
 
     Returns:
@@ -338,19 +405,21 @@ def compute_raga_densities(
 
     for section in sections:
         # Collect all line densities in this raga's ang range
-        all_densities: list[dict[str, float]] = []
+        rows: list[tuple[float, ...]] = []
         for ang in range(section.ang_start, section.ang_end + 1):
-            all_densities.extend(features_by_ang.get(ang, []))
+            rows.extend(features_by_ang.get(ang, []))
 
-        line_count = len(all_densities)
+        line_count = len(rows)
 
         stats: dict[str, dict[str, float]] = {}
-        for dim in FEATURE_DIMENSIONS:
-            values = [d.get(dim, 0.0) for d in all_densities]
+        for dim, values in zip(
+            FEATURE_DIMENSIONS, _columns(rows), strict=True,
+        ):
+            mean = _safe_mean(values)
             stats[dim] = {
-                "mean": _safe_mean(values),
+                "mean": mean,
                 "median": _safe_median(values),
-                "stdev": _safe_stdev(values),
+                "stdev": _safe_stdev(values, mean),
             }
 
         results.append(
@@ -380,7 +449,12 @@ def compute_sliding_window(
     """Compute rolling-mean density using a sliding window.
 
     Slides a window of ``window_size`` angs across all angs, computing
-    the mean density per register within each window position.
+    the mean density per register within each window position. Angs
+    with no lines are skipped, so each mean is over the angs present.
+
+    Densities are laid out once as one column per dimension over the
+    present angs, so each window is a slice of every column located by
+    bisection, averaged with :func:`_safe_mean`.
 
     Args:
         ang_densities: Per-ang density records (sorted by ang).
@@ -392,44 +466,30 @@ def compute_sliding_window(
     if not ang_densities or window_size < 1:
         return []
 
-    results: list[WindowDensity] = []
-
-    # Build ang -> densities lookup
     density_lookup: dict[int, dict[str, float]] = {
         ad.ang: ad.densities for ad in ang_densities
     }
+    present_angs = sorted(density_lookup)
+    columns: dict[str, list[float]] = {
+        dim: [density_lookup[ang].get(dim, 0.0) for ang in present_angs]
+        for dim in FEATURE_DIMENSIONS
+    }
+    min_ang = present_angs[0]
+    max_ang = present_angs[-1]
 
-    all_angs = sorted(density_lookup.keys())
-    if not all_angs:
-        return []
-
-    min_ang = all_angs[0]
-    max_ang = all_angs[-1]
-
+    results: list[WindowDensity] = []
     for start in range(min_ang, max_ang - window_size + 2):
         end = start + window_size - 1
-
-        # Collect densities from angs in this window
-        window_dims: dict[str, list[float]] = {
-            dim: [] for dim in FEATURE_DIMENSIONS
-        }
-        for ang in range(start, end + 1):
-            if ang in density_lookup:
-                for dim in FEATURE_DIMENSIONS:
-                    window_dims[dim].append(
-                        density_lookup[ang].get(dim, 0.0),
-                    )
-
-        # Compute mean for this window
-        mean_densities: dict[str, float] = {}
-        for dim in FEATURE_DIMENSIONS:
-            mean_densities[dim] = _safe_mean(window_dims[dim])
-
+        lo = bisect_left(present_angs, start)
+        hi = bisect_right(present_angs, end)
         results.append(
             WindowDensity(
                 window_start=start,
                 window_end=end,
-                densities=mean_densities,
+                densities={
+                    dim: _safe_mean(column[lo:hi])
+                    for dim, column in columns.items()
+                },
             ),
         )
 
@@ -530,7 +590,8 @@ def _write_output(
         ],
     }
 
-    with output_path.open("w", encoding="utf-8") as fh:
-        json.dump(output, fh, ensure_ascii=False, indent=2)
+    output_path.write_bytes(
+        orjson.dumps(output, option=orjson.OPT_INDENT_2),
+    )
 
     _console.print(f"  Written to {output_path}")
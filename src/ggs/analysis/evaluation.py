@@ -24,15 +24,18 @@ Reference: PLAN.md Section 6.2
 from __future__ import annotations
 
 import csv
-import json
-from collections import defaultdict
-from dataclasses import dataclass, field
+from collections import Counter, defaultdict
+from dataclasses import dataclass
 from io import StringIO
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TextIO
 
+import orjson
 from rich.console import Console
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 _console = Console()
 
 
@@ -56,7 +59,7 @@ class GoldLabel:
 
     line_uid: str
     category: str
-    secondary_categories: list[str] = field(default_factory=list)
+    secondary_categories: tuple[str, ...] = ()
     confidence: str = "certain"
     annotator: str = ""
     notes: str = ""
@@ -65,7 +68,7 @@ class GoldLabel:
         return {
             "line_uid": self.line_uid,
             "category": self.category,
-            "secondary_categories": self.secondary_categories,
+            "secondary_categories": list(self.secondary_categories),
             "confidence": self.confidence,
             "annotator": self.annotator,
             "notes": self.notes,
@@ -77,8 +80,8 @@ class GoldLabel:
         return cls(
             line_uid=data.get("line_uid", ""),
             category=data.get("category", ""),
-            secondary_categories=list(
-                data.get("secondary_categories", []),
+            secondary_categories=tuple(
+                data.get("secondary_categories") or (),
             ),
             confidence=data.get("confidence", "certain"),
             annotator=data.get("annotator", ""),
@@ -99,13 +102,11 @@ def load_gold_labels(path: Path) -> list[GoldLabel]:
         FileNotFoundError: If the file does not exist.
     """
     labels: list[GoldLabel] = []
-    with path.open(encoding="utf-8") as fh:
+    with path.open("rb") as fh:
         for line in fh:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
-            data = json.loads(line)
-            labels.append(GoldLabel.from_dict(data))
+            labels.append(GoldLabel.from_dict(orjson.loads(line)))
     return labels
 
 
@@ -120,11 +121,11 @@ def save_gold_labels(
         path: Output path.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fh:
-        for label in labels:
-            fh.write(
-                json.dumps(label.to_dict(), ensure_ascii=False) + "\n",
-            )
+    with path.open("wb") as fh:
+        fh.writelines(
+            orjson.dumps(label.to_dict(), option=orjson.OPT_APPEND_NEWLINE)
+            for label in labels
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -176,48 +177,69 @@ def _compute_f1(precision: float, recall: float) -> float:
     return 2.0 * (precision * recall) / (precision + recall)
 
 
-def compute_category_metrics(
+def _gold_by_uid(gold_labels: list[GoldLabel]) -> dict[str, str]:
+    """Map each gold line_uid to its category (last label wins)."""
+    return {g.line_uid: g.category for g in gold_labels}
+
+
+def _pair_predictions(
     gold_labels: list[GoldLabel],
     predicted: dict[str, str | None],
-    category: str,
-) -> CategoryMetrics:
-    """Compute precision, recall, F1 for a single category.
+) -> Iterator[tuple[GoldLabel, str | None]]:
+    """Pair each gold label with its prediction (None if missing)."""
+    get = predicted.get
+    return ((g, get(g.line_uid)) for g in gold_labels)
+
+
+def _mismatches(
+    pairs: Iterable[tuple[GoldLabel, str | None]],
+) -> Iterator[tuple[GoldLabel, str | None]]:
+    """Gold labels whose prediction differs from the gold category."""
+    return ((g, pred) for g, pred in pairs if pred != g.category)
+
+
+def _count_outcomes(
+    predicted: dict[str, str | None],
+    gold_by_uid: dict[str, str],
+    pairs: Iterable[tuple[GoldLabel, str | None]],
+) -> tuple[Counter[str | None], Counter[str | None], Counter[str]]:
+    """Count true positives, false positives and false negatives.
+
+    One pass over the predictions and one over the gold labels yields
+    the counts for every category at once, keyed by category.
 
     Args:
-        gold_labels: Gold standard labels.
         predicted: Mapping from line_uid to predicted primary_tag.
-        category: The category to evaluate.
+        gold_by_uid: :func:`_gold_by_uid` of the gold labels.
+        pairs: :func:`_pair_predictions` of the gold labels.
 
     Returns:
-        A :class:`CategoryMetrics` instance.
+        ``(tp, fp, fn)`` counters. ``tp`` and ``fp`` are keyed by the
+        predicted tag; ``fn`` by the gold category.
     """
-    tp = 0
-    fp = 0
-    fn = 0
-
-    gold_by_uid: dict[str, str] = {
-        g.line_uid: g.category for g in gold_labels
-    }
+    # Predictions outside the gold set are skipped
+    aligned = [
+        (gold_by_uid[line_uid], pred_tag)
+        for line_uid, pred_tag in predicted.items()
+        if line_uid in gold_by_uid
+    ]
+    tp: Counter[str | None] = Counter(
+        pred_tag for gold_tag, pred_tag in aligned if pred_tag == gold_tag
+    )
+    fp: Counter[str | None] = Counter(
+        pred_tag for gold_tag, pred_tag in aligned if pred_tag != gold_tag
+    )
+    fn = Counter(g.category for g, _ in _mismatches(pairs))
+    return tp, fp, fn
 
-    # Check all predictions
-    for line_uid, pred_tag in predicted.items():
-        gold_tag = gold_by_uid.get(line_uid)
-        if gold_tag is None:
-            # Not in gold set — skip
-            continue
-
-        if pred_tag == category and gold_tag == category:
-            tp += 1
-        elif pred_tag == category and gold_tag != category:
-            fp += 1
-
-    # Check all gold labels for false negatives
-    for gold in gold_labels:
-        if gold.category == category:
-            pred_tag = predicted.get(gold.line_uid)
-            if pred_tag != category:
-                fn += 1
 
+def _metrics_from_counts(
+    category: str,
+    tp: int,
+    fp: int,
+    fn: int,
+) -> CategoryMetrics:
+    """Build :class:`CategoryMetrics` from raw TP/FP/FN counts."""
     precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
     recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
     f1 = _compute_f1(precision, recall)
@@ -235,6 +257,31 @@ def compute_category_metrics(
     )
 
 
+def compute_category_metrics(
+    gold_labels: list[GoldLabel],
+    predicted: dict[str, str | None],
+    category: str,
+) -> CategoryMetrics:
+    """Compute precision, recall, F1 for a single category.
+
+    Args:
+        gold_labels: Gold standard labels.
+        predicted: Mapping from line_uid to predicted primary_tag.
+        category: The category to evaluate.
+
+    Returns:
+        A :class:`CategoryMetrics` instance.
+    """
+    tp, fp, fn = _count_outcomes(
+        predicted,
+        _gold_by_uid(gold_labels),
+        _pair_predictions(gold_labels, predicted),
+    )
+    return _metrics_from_counts(
+        category, tp[category], fp[category], fn[category],
+    )
+
+
 # ---------------------------------------------------------------------------
 # Full evaluation
 # ---------------------------------------------------------------------------
@@ -290,6 +337,27 @@ def evaluate(
     Returns:
         An :class:`EvaluationResult` with per-category and macro metrics.
     """
+    return _evaluate(
+        gold_labels,
+        predicted,
+        categories,
+        _gold_by_uid(gold_labels),
+        _pair_predictions(gold_labels, predicted),
+    )
+
+
+def _evaluate(
+    gold_labels: list[GoldLabel],
+    predicted: dict[str, str | None],
+    categories: list[str] | None,
+    gold_by_uid: dict[str, str],
+    pairs: Iterable[tuple[GoldLabel, str | None]],
+) -> EvaluationResult:
+    """:func:`evaluate` over a prebuilt gold index and prediction pairs.
+
+    Lets :func:`threshold_sweep` share one gold index across variants
+    and :func:`run_evaluation` share one set of pairs across reports.
+    """
     if categories is None:
         cat_set: set[str] = set()
         for g in gold_labels:
@@ -305,11 +373,11 @@ def evaluate(
         1 for g in gold_labels if g.line_uid in predicted
     )
 
-    per_category: dict[str, CategoryMetrics] = {}
-    for cat in categories:
-        per_category[cat] = compute_category_metrics(
-            gold_labels, predicted, cat,
-        )
+    tp, fp, fn = _count_outcomes(predicted, gold_by_uid, pairs)
+    per_category: dict[str, CategoryMetrics] = {
+        cat: _metrics_from_counts(cat, tp[cat], fp[cat], fn[cat])
+        for cat in categories
+    }
 
     # Macro averages (only over categories with support > 0)
     cats_with_support = [
@@ -380,11 +448,16 @@ def threshold_sweep(
     Returns:
         List of :class:`ThresholdSweepPoint` sorted by name.
     """
+    gold_by_uid = _gold_by_uid(gold_labels)
     results: list[ThresholdSweepPoint] = []
     for name in sorted(predicted_variants.keys()):
-        metrics = evaluate(
-            gold_labels, predicted_variants[name],
-            categories=categories,
+        predicted = predicted_variants[name]
+        metrics = _evaluate(
+            gold_labels,
+            predicted,
+            categories,
+            gold_by_uid,
+            _pair_predictions(gold_labels, predicted),
         )
         results.append(
             ThresholdSweepPoint(threshold_name=name, metrics=metrics),
@@ -411,15 +484,29 @@ def generate_evaluation_csv(
         CSV string.
     """
     output = StringIO()
-    writer = csv.writer(output)
+    write_evaluation_csv(result, output)
+    return output.getvalue()
+
+
+def write_evaluation_csv(
+    result: EvaluationResult,
+    fh: TextIO,
+) -> None:
+    """Write the :func:`generate_evaluation_csv` report to a text stream.
+
+    Args:
+        result: Evaluation results.
+        fh: Destination, opened with ``newline=""`` if it is a file.
+    """
+    writer = csv.writer(fh)
     writer.writerow([
         "category", "precision", "recall", "f1",
         "support", "tp", "fp", "fn",
     ])
 
-    for cat in sorted(result.per_category.keys()):
-        m = result.per_category[cat]
-        writer.writerow([
+    per_category = result.per_category
+    writer.writerows(
+        [
             cat,
             round(m.precision, 4),
             round(m.recall, 4),
@@ -428,7 +515,9 @@ def generate_evaluation_csv(
             m.true_positives,
             m.false_positives,
             m.false_negatives,
-        ])
+        ]
+        for cat, m in sorted(per_category.items())
+    )
 
     # Macro row
     writer.writerow([
@@ -440,8 +529,6 @@ def generate_evaluation_csv(
         "", "", "",
     ])
 
-    return output.getvalue()
-
 
 # ---------------------------------------------------------------------------
 # Error analysis
@@ -489,20 +576,23 @@ def collect_errors(
     Returns:
         List of :class:`ErrorRecord` for all mismatches.
     """
-    errors: list[ErrorRecord] = []
-    for gold in gold_labels:
-        pred = predicted.get(gold.line_uid)
-        if pred != gold.category:
-            errors.append(
-                ErrorRecord(
-                    line_uid=gold.line_uid,
-                    gold_category=gold.category,
-                    predicted_category=pred,
-                    confidence=gold.confidence,
-                    notes=gold.notes,
-                ),
-            )
-    return errors
+    return _collect_errors(_pair_predictions(gold_labels, predicted))
+
+
+def _collect_errors(
+    pairs: Iterable[tuple[GoldLabel, str | None]],
+) -> list[ErrorRecord]:
+    """:func:`collect_errors` over prebuilt prediction pairs."""
+    return [
+        ErrorRecord(
+            line_uid=gold.line_uid,
+            gold_category=gold.category,
+            predicted_category=pred,
+            confidence=gold.confidence,
+            notes=gold.notes,
+        )
+        for gold, pred in _mismatches(pairs)
+    ]
 
 
 def error_confusion_matrix(
@@ -518,12 +608,26 @@ def error_confusion_matrix(
     Returns:
         Nested dict: confusion[gold_category][predicted_category] = count.
     """
+    return _confusion_matrix(
+        _pair_predictions(gold_labels, predicted), predicted,
+    )
+
+
+def _confusion_matrix(
+    pairs: Iterable[tuple[GoldLabel, str | None]],
+    predicted: dict[str, str | None],
+) -> dict[str, dict[str, int]]:
+    """:func:`error_confusion_matrix` over prebuilt prediction pairs."""
     matrix: dict[str, dict[str, int]] = defaultdict(
         lambda: defaultdict(int),
     )
-    for gold in gold_labels:
-        pred = predicted.get(gold.line_uid, "MISSING")
-        pred_label = pred if pred is not None else "unclassified"
+    for gold, pred in pairs:
+        if pred is not None:
+            pred_label = pred
+        elif gold.line_uid in predicted:
+            pred_label = "unclassified"
+        else:
+            pred_label = "MISSING"
         matrix[gold.category][pred_label] += 1
     return {k: dict(v) for k, v in matrix.items()}
 
@@ -570,10 +674,6 @@ def stratified_sample(
         author = rec.get("meta", {}).get("author", "unknown")
         by_author[author].append(rec)
 
-    # Shuffle within each group
-    for group in by_author.values():
-        rng.shuffle(group)
-
     # Round-robin across authors to ensure proportional representation
     sampled: list[dict[str, Any]] = []
     seen_uids: set[str] = set()
@@ -585,10 +685,10 @@ def stratified_sample(
         quota = max(1, round(len(group) / total * target_size))
         quotas[author] = min(quota, len(group))
 
-    # Take from each author proportionally
+    # Take from each author proportionally; drawing just the quota
+    # avoids shuffling whole groups only to keep their heads
     for author in sorted(quotas.keys()):
-        group = by_author[author]
-        for rec in group[: quotas[author]]:
+        for rec in rng.sample(by_author[author], quotas[author]):
             uid = rec.get("line_uid", "")
             if uid not in seen_uids:
                 sampled.append(rec)
@@ -600,12 +700,8 @@ def stratified_sample(
             rec for rec in records
             if rec.get("line_uid", "") not in seen_uids
         ]
-        rng.shuffle(remaining)
-        for rec in remaining:
-            if len(sampled) >= target_size:
-                break
-            sampled.append(rec)
-            seen_uids.add(rec.get("line_uid", ""))
+        shortfall = min(target_size - len(sampled), len(remaining))
+        sampled.extend(rng.sample(remaining, shortfall))
 
     return sampled[:target_size]
 
@@ -640,7 +736,12 @@ def run_evaluation(
     gold = load_gold_labels(gold_path)
     _console.print(f"  Gold labels: {len(gold)}")
 
-    result = evaluate(gold, predicted, categories=categories)
+    # Metrics, errors and the confusion matrix share one prediction
+    # lookup per gold label
+    pairs = list(_pair_predictions(gold, predicted))
+    result = _evaluate(
+        gold, predicted, categories, _gold_by_uid(gold), pairs,
+    )
 
     _console.print(
         f"  Aligned: {result.total_aligned}/{result.total_gold}",
@@ -663,32 +764,31 @@ def run_evaluation(
 
         # Write evaluation CSV
         eval_path = output_dir / "evaluation_metrics.csv"
-        eval_path.write_text(
-            generate_evaluation_csv(result),
-            encoding="utf-8",
-        )
+        with eval_path.open("w", encoding="utf-8", newline="") as fh:
+            write_evaluation_csv(result, fh)
         _console.print(f"  Written {eval_path}")
 
         # Write errors
-        errors = collect_errors(gold, predicted)
+        errors = _collect_errors(pairs)
         if errors:
             errors_path = output_dir / "evaluation_errors.jsonl"
-            with errors_path.open("w", encoding="utf-8") as fh:
-                for err in errors:
-                    fh.write(
-                        json.dumps(
-                            err.to_dict(), ensure_ascii=False,
-                        ) + "\n",
+            with errors_path.open("wb") as fh:
+                fh.writelines(
+                    orjson.dumps(
+                        err.to_dict(), option=orjson.OPT_APPEND_NEWLINE,
                     )
+                    for err in errors
+                )
             _console.print(
                 f"  {len(errors)} errors written to {errors_path}",
             )
 
         # Write confusion matrix
-        matrix = error_confusion_matrix(gold, predicted)
+        matrix = _confusion_matrix(pairs, predicted)
         matrix_path = output_dir / "confusion_matrix.json"
-        with matrix_path.open("w", encoding="utf-8") as fh:
-            json.dump(matrix, fh, ensure_ascii=False, indent=2)
+        matrix_path.write_bytes(
+            orjson.dumps(matrix, option=orjson.OPT_INDENT_2),
+        )
         _console.print(f"  Written {matrix_path}")
 
     return result
@@ -12,11 +12,11 @@ Reference: PLAN.md Section 5
 
 from __future__ import annotations
 
-import json
 from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
+import orjson
 from rich.console import Console
 
 from ggs.analysis.match import MatchRecord
@@ -135,6 +135,14 @@ def _classify_entity(
     return dimensions
 
 
+def _classify_entities(index: LexiconIndex) -> dict[str, list[str]]:
+    """Classify every lexicon entity once, keyed by entity ID."""
+    return {
+        entity_id: _classify_entity(entity_id, index)
+        for entity_id in index.entities
+    }
+
+
 # ---------------------------------------------------------------------------
 # Per-line feature computation
 # ---------------------------------------------------------------------------
@@ -146,6 +154,8 @@ def compute_line_features(
     token_count: int,
     matches: list[MatchRecord],
     index: LexiconIndex,
+    *,
+    entity_dims: dict[str, list[str]] | None = None,
 ) -> dict[str, Any]:
     """Compute feature vector for a single line.
 
@@ -155,32 +165,42 @@ def compute_line_features(
         token_count: Number of tokens in the line.
         matches: Match records for this line.
         index: Lexicon index for entity metadata lookup.
+        entity_dims: Precomputed entity_id -> feature dimensions from
+            :func:`_classify_entities`; entities are classified per
+            match against ``index`` if None.
 
     Returns:
         Feature record dict.
     """
-    features: dict[str, dict[str, Any]] = {
-        dim: _empty_feature() for dim in FEATURE_DIMENSIONS
-    }
-
+    # Collect matched tokens for the dimensions that actually occur;
+    # the per-dimension feature dicts are built once, below
+    matched: dict[str, list[str]] = {}
     for match in matches:
         # Skip nested matches to avoid double-counting
         if match.nested_in is not None:
             continue
 
-        dims = _classify_entity(match.entity_id, index)
+        if entity_dims is not None:
+            dims = entity_dims.get(match.entity_id, [])
+        else:
+            dims = _classify_entity(match.entity_id, index)
         for dim in dims:
-            if dim in features:
-                features[dim]["count"] += 1
-                features[dim]["matched_tokens"].append(
-                    match.matched_form,
-                )
+            if dim in matched:
+                matched[dim].append(match.matched_form)
+            else:
+                matched[dim] = [match.matched_form]
 
-    # Compute densities
+    features: dict[str, dict[str, Any]] = {}
     for dim in FEATURE_DIMENSIONS:
-        features[dim]["density"] = _compute_density(
-            features[dim]["count"], token_count,
-        )
+        tokens = matched.get(dim)
+        if tokens is None:
+            features[dim] = _empty_feature()
+        else:
+            features[dim] = {
+                "count": len(tokens),
+                "density": _compute_density(len(tokens), token_count),
+                "matched_tokens": tokens,
+            }
 
     return {
         "line_uid": line_uid,
@@ -225,9 +245,9 @@ def compute_corpus_features(
     for m in matches:
         matches_by_line[m.line_uid].append(m)
 
-    # Compute features
+    # Compute features, classifying each lexicon entity once up front
+    entity_dims = _classify_entities(index)
     feature_records: list[dict[str, Any]] = []
-
     for rec in records:
         line_uid = rec.get("line_uid", "UNKNOWN")
         shabad_uid = rec.get("meta", {}).get("shabad_uid")
@@ -240,6 +260,7 @@ def compute_corpus_features(
             token_count=token_count,
             matches=line_matches,
             index=index,
+            entity_dims=entity_dims,
         )
         feature_records.append(feat)
 
@@ -259,12 +280,11 @@ def compute_corpus_features(
     # Write output
     if output_path is not None:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with output_path.open("w", encoding="utf-8") as fh:
-            for feat in feature_records:
-                fh.write(
-                    json.dumps(feat, ensure_ascii=False)
-                    + "\n"
-                )
+        with output_path.open("wb") as fh:
+            fh.writelines(
+                orjson.dumps(feat, option=orjson.OPT_APPEND_NEWLINE)
+                for feat in feature_records
+            )
         _console.print(f"  Written to {output_path}")
 
     return feature_records
@@ -18,9 +18,11 @@ Common options (available on all subcommands via the root callback):
 
 from __future__ import annotations
 
+import gc
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich.console import Console
@@ -29,6 +31,9 @@ from rich.table import Table
 
 from ggs import __version__
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
 # ---------------------------------------------------------------------------
 # Console
 # ---------------------------------------------------------------------------
@@ -458,9 +463,10 @@ def analysis_structural(
     )
 
     features_path = output / "features.jsonl"
-    features = compute_corpus_features(
-        records, matches, index, output_path=features_path,
-    )
+    with _cyclic_gc_paused():
+        features = compute_corpus_features(
+            records, matches, index, output_path=features_path,
+        )
 
     _display_result_table("Phase 2: Structural Analysis", {
         "Lines": str(len(records)),
@@ -750,10 +756,11 @@ def pipeline_run(
                 config.get("lexicon_paths", {}),
                 base_dir=_state.config_path.parent.parent,
             )
-            features = compute_corpus_features(
-                records, match_records, index,
-                output_path=features_path,
-            )
+            with _cyclic_gc_paused():
+                features = compute_corpus_features(
+                    records, match_records, index,
+                    output_path=features_path,
+                )
             elapsed = time.monotonic() - t0
             phase_results[2] = {
                 "status": "PASS",
@@ -940,6 +947,23 @@ def _load_jsonl(path: Path) -> list[dict]:
     ]
 
 
+@contextmanager
+def _cyclic_gc_paused() -> Generator[None]:
+    """Pause the cyclic GC around a bulk, acyclic allocation phase.
+
+    The CLI owns the process, so it can skip the collector's repeated
+    full-heap scans while e.g. the feature pass builds tens of
+    thousands of small dicts, none of them part of a cycle.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
 def _load_match_records(path: Path) -> list:
     """Load match records from a JSONL file."""
     import json
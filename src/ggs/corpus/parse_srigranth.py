@@ -40,6 +40,12 @@ BASE_URL = (
     "?Action=Page&Param={ang}"
 )
 
+# SriGranth marks Gurmukhi via <font face=AnmolUni...>, not CSS classes
+_ANMOL_FACE = re.compile(r"^anmol", re.IGNORECASE)
+
+# Whitespace runs left behind by per-word dictionary links
+_WHITESPACE_RUN = re.compile(r"\s+")
+
 # Gurmukhi Rahao marker
 _RAHAO_PATTERN = re.compile(r"ਰਹਾਉ")
 
@@ -165,17 +171,13 @@ def _extract_gurmukhi_lines(soup: BeautifulSoup) -> list[str]:
 
     # Strategy 1: Target <FONT face=AnmolUniPr> elements directly.
     # This is how SriGranth.org marks Gurmukhi text — via font-face,
-    # not CSS classes.
-    for font_elem in soup.find_all("font"):
-        face = font_elem.get("face", "")
-        if not isinstance(face, str):
-            continue
-        if face.lower().startswith("anmol"):
-            text = font_elem.get_text(separator=" ", strip=True)
-            # Collapse multiple spaces from link separators
-            text = re.sub(r"\s+", " ", text).strip()
-            if text and _contains_gurmukhi(text):
-                lines.append(text)
+    # not CSS classes.  The face filter runs inside find_all.
+    for font_elem in soup.find_all("font", face=_ANMOL_FACE):
+        text = font_elem.get_text(separator=" ", strip=True)
+        # Collapse multiple spaces from link separators
+        text = _WHITESPACE_RUN.sub(" ", text).strip()
+        if text and _contains_gurmukhi(text):
+            lines.append(text)
 
     if lines:
         return lines
@@ -5,6 +5,7 @@ Fetches HTML pages for all 1430 angs with:
   - Exponential backoff retry (max 5 retries)
   - Resumable via scrape_state.json
   - Clear User-Agent identification
+  - One HTTP/2 connection reused for the whole run
   - Hard stop on repeated 403/429
 
 Ethics: We are guests on their server.  Rate limiting and transparency
@@ -303,6 +304,7 @@ def scrape_corpus(
 
     with (
         httpx.Client(
+            http2=True,
             headers={"User-Agent": USER_AGENT},
             follow_redirects=True,
         ) as client,
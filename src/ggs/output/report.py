@@ -25,7 +25,11 @@ from typing import Any
 
 from rich.console import Console
 
-from ggs.analysis.density import RagaSection, ang_to_raga, load_raga_sections
+from ggs.analysis.density import (
+    RagaSection,
+    build_ang_to_raga,
+    load_raga_sections,
+)
 from ggs.analysis.match import MatchRecord
 from ggs.lexicon.loader import LexiconIndex
 
@@ -125,6 +129,7 @@ def count_entities_by_raga(
     Returns:
         Mapping from entity_id to {raga_id: count}.
     """
+    ang_raga = build_ang_to_raga(sections)
     counts: dict[str, dict[str, int]] = defaultdict(
         lambda: defaultdict(int),
     )
@@ -133,7 +138,7 @@ def count_entities_by_raga(
             continue
         ang = line_to_ang.get(m.line_uid)
         if ang is not None:
-            raga_id = ang_to_raga(ang, sections)
+            raga_id = ang_raga.get(ang)
             if raga_id is not None:
                 counts[m.entity_id][raga_id] += 1
     return {k: dict(v) for k, v in counts.items()}
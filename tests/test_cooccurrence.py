@@ -720,6 +720,14 @@ class TestFilterByEntityFreq:
         result = _filter_by_entity_freq(windows, min_entity_freq=2)
         assert result == windows
 
+    def test_nothing_dropped_returns_input(self) -> None:
+        windows = {
+            "w1": {"A", "B"},
+            "w2": {"A", "B"},
+        }
+        result = _filter_by_entity_freq(windows, min_entity_freq=2)
+        assert result is windows
+
     def test_empty_windows(self) -> None:
         result = _filter_by_entity_freq({}, min_entity_freq=10)
         assert result == {}
@@ -359,6 +359,32 @@ class TestFindRitualNegationLines:
         assert "TEERATH" in result[0].ritual_entities
         assert "ਨਾ" in result[0].negation_tokens
 
+    def test_unknown_entity_with_ritual_keyword(
+        self, test_index: LexiconIndex,
+    ) -> None:
+        records = [
+            {
+                "line_uid": "line:1",
+                "ang": 1,
+                "gurmukhi": "ਤੀਰਥਿ ਨਾਵਣ ਜਾਉ ਨਾ",
+                "tokens": ["ਤੀਰਥਿ", "ਨਾਵਣ", "ਜਾਉ", "ਨਾ"],
+            },
+        ]
+        matches = [
+            MatchRecord(
+                line_uid="line:1",
+                entity_id=entity_id,
+                matched_form="ਤੀਰਥਿ",
+                span=[0, 6],
+            )
+            for entity_id in ("RITUAL_MARKERS", "UNKNOWN_THING")
+        ]
+        result = find_ritual_negation_lines(
+            records, matches, test_index,
+        )
+        assert len(result) == 1
+        assert result[0].ritual_entities == ["RITUAL_MARKERS"]
+
     def test_no_negation_token(
         self, test_index: LexiconIndex,
     ) -> None:
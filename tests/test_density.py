@@ -7,6 +7,8 @@ raga section loading, and output serialization.
 from __future__ import annotations
 
 import json
+import os
+import statistics
 from pathlib import Path
 
 import pytest
@@ -21,6 +23,7 @@ from ggs.analysis.density import (
     _safe_median,
     _safe_stdev,
     ang_to_raga,
+    build_ang_to_raga,
     compute_all_density_aggregations,
     compute_ang_densities,
     compute_raga_densities,
@@ -50,26 +53,30 @@ def sample_sections() -> list[RagaSection]:
 
 
 @pytest.fixture()
-def sample_features_by_ang() -> dict[int, list[dict[str, float]]]:
-    """Sample density data indexed by ang."""
+def sample_features_by_ang() -> dict[int, list[tuple[float, ...]]]:
+    """Sample density rows indexed by ang."""
     dims = {dim: 0.0 for dim in FEATURE_DIMENSIONS}
+
+    def row(**densities: float) -> tuple[float, ...]:
+        return tuple({**dims, **densities}.values())
+
     return {
         1: [
-            {**dims, "perso_arabic": 0.1, "sanskritic": 0.2},
-            {**dims, "perso_arabic": 0.3, "sanskritic": 0.0},
+            row(perso_arabic=0.1, sanskritic=0.2),
+            row(perso_arabic=0.3, sanskritic=0.0),
         ],
         2: [
-            {**dims, "perso_arabic": 0.0, "sanskritic": 0.4},
+            row(perso_arabic=0.0, sanskritic=0.4),
         ],
         3: [
-            {**dims, "perso_arabic": 0.2, "sanskritic": 0.1},
+            row(perso_arabic=0.2, sanskritic=0.1),
         ],
         4: [
-            {**dims, "perso_arabic": 0.5, "sanskritic": 0.0},
+            row(perso_arabic=0.5, sanskritic=0.0),
         ],
         5: [
-            {**dims, "perso_arabic": 0.0, "sanskritic": 0.6},
-            {**dims, "perso_arabic": 0.1, "sanskritic": 0.5},
+            row(perso_arabic=0.0, sanskritic=0.6),
+            row(perso_arabic=0.1, sanskritic=0.5),
         ],
     }
 
@@ -126,6 +133,14 @@ class TestSafeStats:
         result = _safe_stdev([1.0, 2.0, 3.0])
         assert result > 0.0
 
+    def test_safe_stdev_matches_statistics(self) -> None:
+        values = [0.1, 0.25, 0.0, 0.6, 0.125, 0.3]
+        expected = statistics.stdev(values)
+        assert _safe_stdev(values) == pytest.approx(expected, rel=1e-12)
+        assert _safe_stdev(values, sum(values) / len(values)) == (
+            pytest.approx(expected, rel=1e-12)
+        )
+
     def test_safe_stdev_empty(self) -> None:
         assert _safe_stdev([]) == 0.0
 
@@ -148,6 +163,21 @@ class TestRagaSections:
         assert sections[1].id == "SRI"
         assert sections[2].id == "EPILOGUE"
 
+    def test_load_raga_sections_reloads_on_change(
+        self, ragas_yaml: Path,
+    ) -> None:
+        first = load_raga_sections(ragas_yaml)
+        assert load_raga_sections(ragas_yaml) == first
+
+        data = yaml.safe_load(ragas_yaml.read_text(encoding="utf-8"))
+        data["ragas"][0]["ang_end"] = 7
+        ragas_yaml.write_text(yaml.dump(data), encoding="utf-8")
+        stat = ragas_yaml.stat()
+        os.utime(
+            ragas_yaml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000),
+        )
+        assert load_raga_sections(ragas_yaml)[1].ang_end == 7
+
     def test_ang_to_raga(
         self, sample_sections: list[RagaSection],
     ) -> None:
@@ -161,6 +191,16 @@ class TestRagaSections:
     ) -> None:
         assert ang_to_raga(99, sample_sections) is None
 
+    def test_build_ang_to_raga_agrees_with_scan(self) -> None:
+        sections = [
+            RagaSection(id="A", romanized="A", ang_start=1, ang_end=5),
+            RagaSection(id="B", romanized="B", ang_start=4, ang_end=8),
+            RagaSection(id="C", romanized="C", ang_start=12, ang_end=12),
+        ]
+        ang_raga = build_ang_to_raga(sections)
+        for ang in range(0, 15):
+            assert ang_raga.get(ang) == ang_to_raga(ang, sections)
+
     def test_real_ragas_yaml(self) -> None:
         """Load the actual ragas.yaml from config."""
         path = Path("config/ragas.yaml")
@@ -203,6 +243,9 @@ class TestIndexFeaturesByAng:
         )
         assert len(result[1]) == 2  # two lines on ang 1
         assert len(result[2]) == 1
+        pa = FEATURE_DIMENSIONS.index("perso_arabic")
+        assert [row[pa] for row in result[1]] == [0.1, 0.2]
+        assert len(result[1][0]) == len(FEATURE_DIMENSIONS)
 
     def test_missing_ang_skipped(self) -> None:
         corpus_records = [
@@ -398,6 +441,27 @@ class TestComputeSlidingWindow:
         assert len(windows) == 1
         assert windows[0].densities["perso_arabic"] == 0.5
 
+    def test_mean_skips_missing_angs(self) -> None:
+        ang_densities = [
+            AngDensity(
+                ang=ang, line_count=1, densities={"perso_arabic": value},
+            )
+            for ang, value in [(1, 0.1), (2, 0.2), (4, 0.6), (5, 0.0005)]
+        ]
+        windows = compute_sliding_window(
+            ang_densities, window_size=3,
+        )
+        means = [w.densities["perso_arabic"] for w in windows]
+        assert means == [
+            pytest.approx(0.15), pytest.approx(0.4), pytest.approx(0.30025),
+        ]
+        singles = compute_sliding_window(
+            ang_densities, window_size=1,
+        )
+        assert [w.densities["perso_arabic"] for w in singles] == [
+            0.1, 0.2, 0.0, 0.6, 0.0005,
+        ]
+
     def test_empty_input(self) -> None:
         windows = compute_sliding_window([], window_size=5)
         assert windows == []
@@ -0,0 +1,95 @@
+"""srigurugranth.com download script parser tests.
+
+Covers the lxml fallback that ``parse_ang`` uses when the regex pass
+finds no ``<P class=Gurb>`` lines.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+SCRIPT_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "scripts" / "download_srigurugranth.py"
+)
+
+
+@pytest.fixture(scope="module")
+def download_script() -> ModuleType:
+    """Import the download script as a module."""
+    spec = importlib.util.spec_from_file_location(
+        "download_srigurugranth", SCRIPT_PATH,
+    )
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Two classes on the <p> keep the regex pass from matching, so these
+# pages always go through the lxml fallback.
+_FALLBACK_PAGE = (
+    '<html><body><p class="Gurb verse"><span lang=PA>ਸਤਿ ਨਾਮੁ</span></p>'
+    '<p class="Roman"><span>sat naam</span></p></body></html>'
+)
+
+
+class TestExtractGurbLinesXpath:
+    """Tests for the lxml fallback extractor."""
+
+    def test_extracts_gurb_lines(self, download_script: ModuleType) -> None:
+        lines = download_script._extract_gurb_lines_xpath(
+            _FALLBACK_PAGE.encode("utf-8"),
+        )
+        assert lines == ["ਸਤਿ ਨਾਮੁ"]
+
+    def test_encoding_declared_page(
+        self, download_script: ModuleType,
+    ) -> None:
+        """An XML encoding prolog does not stop the fallback."""
+        page = '<?xml version="1.0" encoding="utf-8"?>' + _FALLBACK_PAGE
+        lines = download_script._extract_gurb_lines_xpath(
+            page.encode("utf-8"),
+        )
+        assert lines == ["ਸਤਿ ਨਾਮੁ"]
+
+    @pytest.mark.parametrize(
+        "page",
+        [b"", b"   ", b"<!-- no content -->", b'<?xml version="1.0"?>'],
+    )
+    def test_unparseable_page(
+        self, download_script: ModuleType, page: bytes,
+    ) -> None:
+        """Pages lxml rejects yield no lines instead of raising."""
+        assert download_script._extract_gurb_lines_xpath(page) == []
+
+    def test_invalid_utf8_does_not_raise(
+        self, download_script: ModuleType,
+    ) -> None:
+        page = b'<p class="gurb x"><span>\xff\xfe ok</span></p>'
+        lines = download_script._extract_gurb_lines_xpath(page)
+        assert len(lines) == 1
+
+
+class TestParseAng:
+    """Tests for parse_ang on pages that need the fallback."""
+
+    def test_encoding_declared_page(
+        self,
+        download_script: ModuleType,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(download_script, "RAW_DIR", tmp_path)
+        page = '<?xml version="1.0" encoding="utf-8"?>' + _FALLBACK_PAGE
+        (tmp_path / "ang_0001.html").write_bytes(page.encode("utf-8"))
+
+        records = download_script.parse_ang(1)
+        assert len(records) == 1
+        assert records[0]["ang"] == 1
+        assert records[0]["gurmukhi_raw"] == "ਸਤਿ ਨਾਮੁ"
@@ -11,6 +11,7 @@ import csv
 from io import StringIO
 from pathlib import Path
 
+import orjson
 import pytest
 
 from ggs.analysis.evaluation import (
@@ -29,6 +30,7 @@ from ggs.analysis.evaluation import (
     save_gold_labels,
     stratified_sample,
     threshold_sweep,
+    write_evaluation_csv,
 )
 
 # ---------------------------------------------------------------------------
@@ -78,7 +80,7 @@ class TestGoldLabel:
         label = GoldLabel(
             line_uid="line:42",
             category="nirgun_leaning",
-            secondary_categories=["universalism"],
+            secondary_categories=("universalism",),
             confidence="certain",
             annotator="hsingh",
             notes="Test roundtrip",
@@ -87,6 +89,7 @@ class TestGoldLabel:
         assert restored.line_uid == label.line_uid
         assert restored.category == label.category
         assert restored.secondary_categories == label.secondary_categories
+        assert label.to_dict()["secondary_categories"] == ["universalism"]
         assert restored.confidence == label.confidence
 
 
@@ -323,6 +326,35 @@ class TestEvaluate:
         assert result.total_gold == 2
         assert result.total_aligned == 1
 
+    def test_per_category_counts(self) -> None:
+        gold = [
+            GoldLabel(line_uid="line:1", category="nirgun_leaning"),
+            GoldLabel(line_uid="line:2", category="mixed"),
+            GoldLabel(line_uid="line:3", category="nirgun_leaning"),
+            GoldLabel(line_uid="line:4", category="mixed"),
+        ]
+        predicted = {
+            "line:1": "nirgun_leaning",
+            "line:2": "nirgun_leaning",
+            "line:3": None,
+            "line:9": "mixed",  # not in gold, ignored
+        }
+        result = evaluate(gold, predicted)
+        nirgun = result.per_category["nirgun_leaning"]
+        mixed = result.per_category["mixed"]
+        assert (
+            nirgun.true_positives,
+            nirgun.false_positives,
+            nirgun.false_negatives,
+        ) == (1, 1, 1)
+        assert (
+            mixed.true_positives,
+            mixed.false_positives,
+            mixed.false_negatives,
+        ) == (0, 0, 2)
+        for cat, metrics in result.per_category.items():
+            assert metrics == compute_category_metrics(gold, predicted, cat)
+
     def test_macro_averages(self) -> None:
         gold = [
             GoldLabel(line_uid="line:1", category="nirgun_leaning"),
@@ -393,6 +425,26 @@ class TestThresholdSweep:
         assert points[0].threshold_name == "loose"
         assert points[1].threshold_name == "strict"
 
+    def test_matches_evaluate_per_variant(self) -> None:
+        gold = [
+            GoldLabel(line_uid="line:1", category="nirgun_leaning"),
+            GoldLabel(line_uid="line:2", category="mixed"),
+            GoldLabel(line_uid="line:1", category="mixed"),
+        ]
+        variants: dict[str, dict[str, str | None]] = {
+            "strict": {"line:1": "mixed", "line:2": None},
+            "loose": {
+                "line:1": "nirgun_leaning",
+                "line:2": "nirgun_leaning",
+                "line:9": "ethical",
+            },
+        }
+        points = threshold_sweep(gold, variants)
+        for point in points:
+            assert point.metrics == evaluate(
+                gold, variants[point.threshold_name],
+            )
+
     def test_empty_variants(self) -> None:
         gold = [GoldLabel(line_uid="line:1", category="nirgun_leaning")]
         points = threshold_sweep(gold, {})
@@ -564,6 +616,19 @@ class TestGenerateEvaluationCsv:
         rows = list(reader)
         assert len(rows) == 1  # Just MACRO row
 
+    def test_write_to_file_matches_string(self, tmp_path: Path) -> None:
+        gold = [
+            GoldLabel(line_uid="line:1", category="nirgun_leaning"),
+            GoldLabel(line_uid="line:2", category="mixed"),
+        ]
+        result = evaluate(gold, {"line:1": "nirgun_leaning", "line:2": None})
+        path = tmp_path / "metrics.csv"
+        with path.open("w", encoding="utf-8", newline="") as fh:
+            write_evaluation_csv(result, fh)
+        assert path.read_bytes() == generate_evaluation_csv(
+            result,
+        ).encode("utf-8")
+
 
 # ---------------------------------------------------------------------------
 # Stratified sampling tests
@@ -676,6 +741,17 @@ class TestStratifiedSample:
         # Very unlikely to be identical with different seeds
         assert uids1 != uids2
 
+    def test_fill_tops_up_with_unsampled_lines(self) -> None:
+        # Quotas round down to 3 per author, so one line comes from fill
+        records = [
+            {"line_uid": f"line:{i}", "meta": {"author": f"a{i % 3}"}}
+            for i in range(100)
+        ]
+        sample = stratified_sample(records, target_size=10)
+        uids = [r["line_uid"] for r in sample]
+        assert len(uids) == 10
+        assert len(set(uids)) == 10
+
 
 # ---------------------------------------------------------------------------
 # End-to-end tests
@@ -738,3 +814,37 @@ class TestRunEvaluation:
         )
         # No errors -> errors file should not exist
         assert not (output_dir / "evaluation_errors.jsonl").exists()
+
+    def test_reports_match_public_functions(self, tmp_path: Path) -> None:
+        gold = [
+            GoldLabel(line_uid="line:1", category="nirgun_leaning"),
+            GoldLabel(line_uid="line:2", category="mixed"),
+            GoldLabel(line_uid="line:3", category="mixed"),
+            GoldLabel(line_uid="line:1", category="mixed"),
+        ]
+        gold_path = tmp_path / "gold.jsonl"
+        save_gold_labels(gold, gold_path)
+        predicted: dict[str, str | None] = {
+            "line:1": "nirgun_leaning",
+            "line:2": None,
+            "line:9": "ethical",
+        }
+        output_dir = tmp_path / "eval"
+        result = run_evaluation(
+            gold_path, predicted, output_dir=output_dir,
+        )
+
+        assert result == evaluate(gold, predicted)
+        errors = [
+            orjson.loads(line)
+            for line in (
+                output_dir / "evaluation_errors.jsonl"
+            ).read_bytes().splitlines()
+        ]
+        assert errors == [
+            err.to_dict() for err in collect_errors(gold, predicted)
+        ]
+        matrix = orjson.loads(
+            (output_dir / "confusion_matrix.json").read_bytes(),
+        )
+        assert matrix == error_confusion_matrix(gold, predicted)
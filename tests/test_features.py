@@ -13,6 +13,7 @@ import pytest
 
 from ggs.analysis.features import (
     FEATURE_DIMENSIONS,
+    _classify_entities,
     _classify_entity,
     _compute_density,
     _empty_feature,
@@ -184,6 +185,35 @@ class TestComputeLineFeatures:
             feat["features"]["sanskritic"]["density"] - 0.1,
         ) < 1e-6
 
+    def test_precomputed_entity_dims(
+        self, test_index: LexiconIndex,
+    ) -> None:
+        """Classifying entities up front gives the same features."""
+        matches = [
+            MatchRecord(
+                line_uid="test:1",
+                entity_id=entity_id,
+                matched_form="ਤੀਰਥ",
+                span=[0, 4],
+            )
+            for entity_id in ("TEERATH", "NAAM", "NOT_IN_LEXICON")
+        ]
+        precomputed = compute_line_features(
+            line_uid="test:1",
+            shabad_uid="shabad:1",
+            token_count=10,
+            matches=matches,
+            index=test_index,
+            entity_dims=_classify_entities(test_index),
+        )
+        assert precomputed == compute_line_features(
+            line_uid="test:1",
+            shabad_uid="shabad:1",
+            token_count=10,
+            matches=matches,
+            index=test_index,
+        )
+
     def test_density_bounds(
         self, test_index: LexiconIndex,
     ) -> None: